@@ -0,0 +1,72 @@
+"""
+Compare the interpreted create_output path with the compiled formatters for
+a list endpoint.
+
+    python benchmarks/bench_create_output.py
+"""
+import enum
+import timeit
+from http import HTTPStatus
+
+import arrow
+
+from dos import prop
+from dos.compiler import compile_output_schema
+from dos.flask_wrappers import create_output
+
+NUMBER_OF_RUNS = 50
+NUMBER_OF_ROWS = 1000
+
+
+class Status(enum.Enum):
+    ACTIVE = "active"
+
+
+OUTPUT_SCHEMA = {
+    HTTPStatus.OK: {
+        "results": prop.Array(
+            repeated_structure=prop.Object(
+                structure={
+                    "id": prop.Integer(),
+                    "name": prop.String(),
+                    "price": prop.Number(),
+                    "status": prop.Enum(),
+                    "created": prop.DateTime(),
+                    "notes": prop.String(required=False, nullable=True),
+                }
+            )
+        ),
+        "total": prop.Integer(),
+    }
+}
+
+RESULT = HTTPStatus.OK, {
+    "results": [
+        {
+            "id": row,
+            "name": f"row {row}",
+            "price": 12.5,
+            "status": Status.ACTIVE,
+            "created": arrow.get(2020, 7, 1),
+            "notes": None,
+            "secret": "not this",
+        }
+        for row in range(NUMBER_OF_ROWS)
+    ],
+    "total": NUMBER_OF_ROWS,
+}
+
+
+def main():
+    compiled_formatters = compile_output_schema(OUTPUT_SCHEMA)
+
+    interpreted = timeit.timeit(lambda: create_output(RESULT, OUTPUT_SCHEMA), number=NUMBER_OF_RUNS)
+    compiled = timeit.timeit(lambda: create_output(RESULT, OUTPUT_SCHEMA, compiled_formatters), number=NUMBER_OF_RUNS)
+
+    print(f"{NUMBER_OF_ROWS} rows: interpreted {interpreted * 1e3 / NUMBER_OF_RUNS:7.2f}ms  "
+          f"compiled {compiled * 1e3 / NUMBER_OF_RUNS:7.2f}ms  "
+          f"speedup {interpreted / compiled:4.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Measure how long `import dos` takes from a cold interpreter, using
+python -X importtime, and fail if arrow or Flask get imported eagerly.
+
+    python benchmarks/bench_import_time.py [--budget-ms 50]
+"""
+import argparse
+import subprocess
+import sys
+
+MODULES = ["dos.prop", "dos.prop_wrapper", "dos.validators", "dos.schema", "dos.open_api", "dos.flask_wrappers"]
+LAZY_DEPENDENCIES = ["arrow", "flask"]
+NUMBER_OF_RUNS = 5
+
+
+def measure_import():
+    """Return the cumulative microseconds of each top level import, for one cold import of MODULES."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + ", ".join(MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative = {}
+
+    # Lines look like "import time:       123 |        456 |   package.module", nested imports being indented.
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, timings = line.split(":", 1)
+        _, cumulative_us, module = timings.split("|")
+        cumulative[module[1:]] = int(cumulative_us)
+
+    return cumulative
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if importing dos takes longer")
+    arguments = parser.parse_args()
+
+    runs = [measure_import() for _ in range(NUMBER_OF_RUNS)]
+    # Modules imported at the top level (not nested under another import) are what `import dos` costs.
+    best_ms = min(
+        sum(cumulative_us for module, cumulative_us in run.items() if module.startswith("dos")) for run in runs
+    ) / 1e3
+
+    imported = {module.strip() for module in runs[0]}
+    eager = [dependency for dependency in LAZY_DEPENDENCIES if dependency in imported]
+
+    print(f"import dos: {best_ms:6.2f}ms (best of {NUMBER_OF_RUNS})")
+
+    if eager:
+        print(f"imported eagerly: {', '.join(eager)}")
+        sys.exit(1)
+
+    if arguments.budget_ms is not None and best_ms > arguments.budget_ms:
+        print(f"over the budget of {arguments.budget_ms}ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
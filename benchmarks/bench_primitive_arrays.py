@@ -0,0 +1,46 @@
+"""
+Compare element by element parsing of Number and DateTime arrays with the
+batched path.
+
+    python benchmarks/bench_primitive_arrays.py
+"""
+import timeit
+
+from dos import prop
+
+NUMBER_OF_RUNS = 20
+NUMBER_OF_ELEMENTS = 5000
+
+INPUT_SCHEMA = {
+    "prices": prop.Array(repeated_structure=prop.Number()),
+    "days": prop.Array(repeated_structure=prop.DateTime()),
+}
+
+BODY = {
+    "prices": [str(element * 1.5) for element in range(NUMBER_OF_ELEMENTS)],
+    "days": ["2020-07-01T10:00:00"] * NUMBER_OF_ELEMENTS,
+}
+
+
+def validate():
+    for field_name, field_prop in INPUT_SCHEMA.items():
+        field_prop.check_input(field_name, BODY)
+
+
+def main():
+    batched = timeit.timeit(validate, number=NUMBER_OF_RUNS)
+
+    original = prop.parse_primitive_elements
+    prop.parse_primitive_elements = lambda element_prop, elements: None
+    try:
+        per_element = timeit.timeit(validate, number=NUMBER_OF_RUNS)
+    finally:
+        prop.parse_primitive_elements = original
+
+    print(f"{NUMBER_OF_ELEMENTS} elements: per element {per_element * 1e3 / NUMBER_OF_RUNS:7.2f}ms  "
+          f"batched {batched * 1e3 / NUMBER_OF_RUNS:7.2f}ms  "
+          f"speedup {per_element / batched:4.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Compare the character-level social security number check with the regex it
+replaced, one value at a time, through SocialSecurityNumber.validate_many,
+and through Array input validation, which uses validate_many.
+
+    python benchmarks/bench_social_security_number.py
+"""
+import random
+import re
+import timeit
+
+from dos import prop, validators
+from dos.validation_helpers import validate_social_security_number, validate_social_security_numbers
+
+NUMBER_OF_RUNS = 10
+NUMBER_OF_VALUES = 100000
+
+
+# The previous implementation, kept here for comparison.
+def validate_with_regex(potential_social_security_number):
+    if not isinstance(potential_social_security_number, str):
+        potential_social_security_number = str(potential_social_security_number)
+
+    if re.match(r'^(?!219099999|078051120)(?!666|000|9\d{2})\d{3}(?!00)\d{2}(?!0{4})\d{4}$', potential_social_security_number):
+        return True
+
+    return False
+
+
+def main():
+    generator = random.Random(1)
+    # Mostly well formed numbers, with some malformed ones that can be rejected early.
+    values = [
+        f"{generator.randrange(10 ** 9):09d}" if generator.random() < 0.9 else "123-45-6789"
+        for _ in range(NUMBER_OF_VALUES)
+    ]
+    validator = validators.SocialSecurityNumber()
+    # Only valid numbers, since any invalid element sends the array back through the per-element checks.
+    array_body = {"numbers": [value for value in values if validate_social_security_number(value)]}
+    array_prop = prop.Array(repeated_structure=prop.String(validators=validator))
+
+    runs = {
+        "regex": lambda: [validate_with_regex(value) for value in values],
+        "characters": lambda: [validate_social_security_number(value) for value in values],
+        "bulk": lambda: validate_social_security_numbers(values),
+        "validate_many": lambda: validator.validate_many(prop.String, values),
+    }
+
+    array_runs = {
+        # What Array input validation did for each element before it used validate_many.
+        "per element": lambda: [
+            array_prop.repeated_structure.check_input(f"numbers[{index}]", None, value)
+            for index, value in enumerate(array_body["numbers"])
+        ],
+        "Array input": lambda: array_prop.check_input("numbers", array_body),
+    }
+
+    regex_time = None
+
+    for label, run in runs.items():
+        elapsed = timeit.timeit(run, number=NUMBER_OF_RUNS) / NUMBER_OF_RUNS
+        regex_time = regex_time or elapsed
+
+        print(f"{label:>14}: {elapsed * 1e3:7.2f}ms per {NUMBER_OF_VALUES} values  "
+              f"speedup {regex_time / elapsed:4.2f}x")
+
+    per_element_time = None
+
+    for label, run in array_runs.items():
+        elapsed = timeit.timeit(run, number=NUMBER_OF_RUNS) / NUMBER_OF_RUNS
+        per_element_time = per_element_time or elapsed
+
+        print(f"{label:>14}: {elapsed * 1e3:7.2f}ms per {len(array_body['numbers'])} valid values  "
+              f"speedup {per_element_time / elapsed:4.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compare the peak memory and time of returning a large list endpoint as a
+list (validated and jsonified whole) and as a generator (streamed in chunks).
+
+    python benchmarks/bench_stream_output.py
+"""
+import time
+import tracemalloc
+from http import HTTPStatus
+
+from flask import Flask
+
+from dos import prop
+from dos.flask_wrappers import wrap_route, wrap_validation
+
+NUMBER_OF_ROWS = 100_000
+
+
+class Module:
+
+    @staticmethod
+    def output_schema():
+        return {
+            HTTPStatus.OK: {
+                "results": prop.Array(
+                    repeated_structure=prop.Object(
+                        structure={
+                            "id": prop.Integer(),
+                            "name": prop.String(),
+                            "price": prop.Number(),
+                        }
+                    )
+                ),
+                "total": prop.Integer(),
+            }
+        }
+
+
+def rows():
+    for row in range(NUMBER_OF_ROWS):
+        yield {"id": row, "name": f"row {row}", "price": 12.5}
+
+
+def list_handler():
+    return HTTPStatus.OK, {"results": list(rows()), "total": NUMBER_OF_ROWS}
+
+
+def stream_handler():
+    return HTTPStatus.OK, {"results": rows(), "total": NUMBER_OF_ROWS}
+
+
+def measure(client, path):
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    response = client.get(path, buffered=False)
+    size = sum(len(chunk) for chunk in response.response)
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return size, elapsed, peak
+
+
+def main():
+    app = Flask(__name__)
+    wrap_route(app, wrap_validation(list_handler, Module), "/list", "get")
+    wrap_route(app, wrap_validation(stream_handler, Module), "/stream", "get")
+
+    client = app.test_client()
+
+    for path in ("/list", "/stream"):
+        size, elapsed, peak = measure(client, path)
+        print(f"{path:8} {NUMBER_OF_ROWS} rows, {size / 1e6:5.1f}MB: {elapsed * 1e3:8.1f}ms  peak {peak / 1e6:6.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
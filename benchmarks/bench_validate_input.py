@@ -0,0 +1,61 @@
+"""
+Compare the interpreted validate_input path with the compiled validator.
+
+    python benchmarks/bench_validate_input.py
+"""
+import timeit
+
+from dos import prop, prop_wrapper, validators
+from dos.compiler import compile_input_schema
+from dos.flask_wrappers import validate_input
+
+NUMBER_OF_RUNS = 20000
+
+INPUT_SCHEMA = {
+    "name": prop.String(),
+    "breed": prop.String(required=False),
+    "age": prop.Integer(),
+    "weight": prop.Number(required=False),
+    "vaccinated": prop.Boolean(),
+    "microchip": prop.String(validators=[validators.ExactLength(8)]),
+    "owner_id": prop_wrapper.OneOf([
+        prop.String(validators=[validators.ExactLength(3)]),
+        prop.Integer(),
+    ]),
+}
+
+VALID_BODY = {
+    "name": "Spot",
+    "age": 4,
+    "weight": "12.5",
+    "vaccinated": True,
+    "microchip": "12345678",
+    "owner_id": 12,
+}
+
+INVALID_BODY = {
+    "name": ["Spot"],
+    "age": "four",
+    "vaccinated": "yes",
+    "microchip": "1234",
+    "owner_id": "banana_phone",
+}
+
+
+def main():
+    compiled_validator = compile_input_schema(INPUT_SCHEMA)
+
+    for label, body in (("valid", VALID_BODY), ("invalid", INVALID_BODY)):
+        interpreted = timeit.timeit(lambda body=body: validate_input(body, INPUT_SCHEMA), number=NUMBER_OF_RUNS)
+        compiled = timeit.timeit(
+            lambda body=body: validate_input(body, INPUT_SCHEMA, compiled_validator),
+            number=NUMBER_OF_RUNS,
+        )
+
+        print(f"{label:>8} body: interpreted {interpreted * 1e6 / NUMBER_OF_RUNS:7.2f}us  "
+              f"compiled {compiled * 1e6 / NUMBER_OF_RUNS:7.2f}us  "
+              f"speedup {interpreted / compiled:4.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
+from dos.flask_wrappers import get_validated_input
 from dos.schema import ErrorFields
-from flask import request
 from http import HTTPStatus
 
 from pet_shop.model import CatFields
@@ -11,7 +11,7 @@ def handler():
     Very basic example, in a real API this would be stored in a database.
     """
 
-    body = request.get_json()
+    body = get_validated_input()
 
     name = body["name"]
 
@@ -0,0 +1,444 @@
+import itertools
+from collections.abc import Mapping
+from http import HTTPStatus
+
+from dos import prop as dos_prop
+from dos import prop_wrapper as dos_prop_wrapper
+from dos.schema import FrozenSchema
+
+
+def compile_input_schema(input_schema):
+    """
+    Generate a single function that validates a request body against
+    input_schema, producing the same (http_status, reject_dict,
+    validated_input) as the interpreted validate_and_parse_input. Returns None if the schema can't be compiled,
+    in which case callers should fall back to the interpreted path.
+    """
+
+    if not isinstance(input_schema, Mapping):
+        return None
+
+    for field_prop in input_schema.values():
+        if not isinstance(field_prop, (dos_prop.Prop, dos_prop_wrapper.PropWrapper)):
+            return None
+
+    return InputSchemaCompiler(input_schema).compile()
+
+
+def compile_output_schema(output_schema):
+    """
+    Generate one formatter per HTTP status in output_schema, each building the
+    same response dict as the interpreted create_output. Statuses whose schema
+    can't be compiled are left out, so create_output falls back for them.
+    """
+
+    if not isinstance(output_schema, Mapping):
+        return None
+
+    formatters = {}
+
+    for http_status, schema in output_schema.items():
+        if not isinstance(schema, Mapping):
+            continue
+
+        if not all(isinstance(field_prop, (dos_prop.Prop, dos_prop_wrapper.PropWrapper)) for field_prop in schema.values()):
+            continue
+
+        formatters[http_status] = OutputSchemaCompiler(schema).compile()
+
+    return formatters
+
+
+def check_validators(validators, prop_class, prop_value):
+    for validator in validators:
+        try:
+            error_message = validator.validate_prop(prop_class=prop_class, prop_value=prop_value)
+        except dos_prop.ValidationError as validation_error:
+            return validation_error.message
+
+        if error_message is not None:
+            return error_message
+
+    return None
+
+
+def is_inlinable_prop(field_prop):
+    prop_class = type(field_prop)
+
+    return (
+        isinstance(field_prop, dos_prop.Prop) and
+        prop_class.parse_input_and_validate is dos_prop.Prop.parse_input_and_validate and
+        prop_class.parse_and_check is dos_prop.Prop.parse_and_check and
+        has_default_constraints(prop_class) and
+        isinstance(field_prop.validators, (list, tuple, type(None)))
+    )
+
+
+def has_default_constraints(prop_class):
+    return (
+        prop_class.validate is dos_prop.Prop.validate and
+        prop_class.check_constraints is dos_prop.Prop.check_constraints
+    )
+
+
+def format_null_object(structure):
+    return {
+        field_name: field_prop.format_output_and_validate(field_name, None)
+        for field_name, field_prop in structure.items()
+    }
+
+
+def get_output_kind(field_prop):
+    if not has_default_output_checks(field_prop):
+        return None
+
+    kind = OUTPUT_KINDS.get(type(field_prop).format_and_check)
+
+    if kind == "object" and not isinstance(field_prop.structure, Mapping):
+        return None
+
+    return kind
+
+
+def has_default_output_checks(field_prop):
+    prop_class = type(field_prop)
+
+    return (
+        isinstance(field_prop, dos_prop.Prop) and
+        has_default_constraints(prop_class) and
+        prop_class.format_output_and_validate is dos_prop.Prop.format_output_and_validate and
+        isinstance(field_prop.validators, (list, tuple, type(None)))
+    )
+
+
+# How each format_and_check implementation is compiled; anything else is delegated to.
+OUTPUT_KINDS = {
+    dos_prop.Object.format_and_check: "object",
+    dos_prop.Array.format_and_check: "array",
+    dos_prop.Prop.format_and_check: "leaf",
+}
+
+
+def is_inlinable_one_of(field_prop):
+    return (
+        type(field_prop) is dos_prop_wrapper.OneOf and  # pylint: disable=unidiomatic-typecheck
+        field_prop.discriminator is None and
+        all(is_inlinable_prop(list_prop) for list_prop in field_prop.prop_list)
+    )
+
+
+class SchemaCompiler:
+
+    function_name = None
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.lines = []
+        self.counter = itertools.count()
+        self.namespace = {
+            "HTTPStatus": HTTPStatus,
+            "ValidationError": dos_prop.ValidationError,
+            "PARSE_ERRORS": dos_prop.PARSE_ERRORS,
+            "check_validators": check_validators,
+            "required_message": dos_prop.required_message,
+            "non_nullable_message": dos_prop.non_nullable_message,
+            "wrong_type_message": dos_prop.wrong_type_message,
+            "parse_failure_message": dos_prop.parse_failure_message,
+            "get_one_of_error_message": dos_prop_wrapper.get_one_of_error_message,
+        }
+
+    def constant(self, value, prefix="C"):
+        name = f"{prefix}{next(self.counter)}"
+        self.namespace[name] = value
+        return name
+
+    def variable(self, prefix):
+        return f"{prefix}_{next(self.counter)}"
+
+    def emit(self, indent, line):
+        self.lines.append("    " * indent + line)
+
+    def build(self, label):
+        source = "\n".join(self.lines) + "\n"
+        exec(compile(source, f"<dos compiled {label} {id(self.schema):#x}>", "exec"), self.namespace)  # pylint: disable=exec-used
+
+        function = self.namespace[self.function_name]
+        function.source = source
+        return function
+
+
+class InputSchemaCompiler(SchemaCompiler):
+
+    function_name = "validate_body"
+
+    def compile(self):
+        schema = self.schema if isinstance(self.schema, FrozenSchema) else FrozenSchema(self.schema)
+
+        expected = self.constant(schema.expected_fields, "EXPECTED")
+        required = self.constant(schema.required_fields, "REQUIRED")
+        required_set = self.constant(schema.required_field_set, "REQUIRED_SET")
+
+        self.emit(0, f"def {self.function_name}(body):")
+        self.emit(1, "message = []")
+        self.emit(1, f"if not body.keys() <= {expected}:")
+        self.emit(2, f"unexpected_fields = [key for key in body if key not in {expected}]")
+        self.emit(2, "if len(unexpected_fields) == 1:")
+        self.emit(3, "message.append(f\"An unexpected field was sent to the server: {unexpected_fields[0]}\")")
+        self.emit(2, "else:")
+        self.emit(3, "message.append(f\"Unexpected fields were sent to the server: {str(unexpected_fields)}\")")
+        self.emit(1, f"if not body.keys() >= {required_set}:")
+        self.emit(2, f"missing_required_fields = [field for field in {required} if field not in body]")
+        self.emit(2, "if len(missing_required_fields) == 1:")
+        self.emit(3, "message.append(f\"A required field is missing: {missing_required_fields[0]}\")")
+        self.emit(2, "else:")
+        self.emit(3, "message.append(f\"Required fields are missing: {missing_required_fields}\")")
+        self.emit(1, "if message:")
+        self.emit(2, "return HTTPStatus.BAD_REQUEST, {\"message\": \" /// \".join(message)}, None")
+        self.emit(1, "field_error_messages = {}")
+        self.emit(1, "validated_input = {}")
+
+        for field_name, field_prop in self.schema.items():
+            self.emit_field(field_name, field_prop)
+
+        self.emit(1, "if not field_error_messages:")
+        self.emit(2, "return HTTPStatus.OK, {}, validated_input")
+        self.emit(1, "if len(field_error_messages) == 1:")
+        self.emit(2, "field_message = \"A field has an error.\"")
+        self.emit(1, "else:")
+        self.emit(2, "field_message = \"Multiple fields have an error.\"")
+        self.emit(1, "return HTTPStatus.BAD_REQUEST, {")
+        self.emit(2, "\"message\": field_message,")
+        self.emit(2, "\"field_error_messages\": field_error_messages,")
+        self.emit(1, "}, None")
+
+        return self.build("input schema")
+
+    def emit_field(self, field_name, field_prop):
+        name = self.constant(field_name, "NAME")
+
+        def fail(indent, expression):
+            self.emit(indent, f"field_error_messages[{name}] = str({expression})")
+
+        def succeed(indent, parsed="value"):
+            self.emit(indent, f"if {name} in body:")
+            self.emit(indent + 1, f"validated_input[{name}] = {parsed}")
+
+        self.emit(1, f"value = body.get({name})")
+
+        if is_inlinable_prop(field_prop):
+            self.emit_prop_check(1, field_prop, name, "value", "value", fail=fail, succeed=succeed)
+        elif is_inlinable_one_of(field_prop):
+            self.emit_one_of_check(1, field_prop, name, fail, succeed)
+        else:
+            prop_name = self.constant(field_prop, "PROP")
+            self.emit(1, f"value, failure = {prop_name}.check_input({name}, body, value)")
+            self.emit(1, "if failure is not None:")
+            self.emit(2, f"field_error_messages.update(failure.get_field_error_messages({name}))")
+            self.emit(1, "else:")
+            succeed(2)
+
+    def emit_one_of_check(self, indent, one_of, name, fail, succeed):
+        def fail_alternative(alternative_indent, expression):
+            self.emit(alternative_indent, f"reasons.append({expression})")
+
+        def succeed_alternative(alternative_indent):
+            self.emit(alternative_indent, "matched = True")
+
+        self.emit(indent, "reasons = []")
+        self.emit(indent, "matched = False")
+
+        for list_prop in one_of.prop_list:
+            self.emit(indent, "if not matched:")
+            self.emit_prop_check(
+                indent + 1, list_prop, name, "value", "candidate", fail=fail_alternative, succeed=succeed_alternative
+            )
+
+        self.emit(indent, "if not matched:")
+        fail(indent + 1, f"get_one_of_error_message(reasons, value, {name})")
+        self.emit(indent, "else:")
+        succeed(indent + 1, "candidate")
+
+    def emit_prop_check(self, indent, field_prop, name, raw, parsed, *, fail, succeed):
+        prop_name = self.constant(field_prop, "PROP")
+
+        if type(field_prop).parse_input is not dos_prop.Prop.parse_input:
+            parse = self.constant(field_prop.parse_input, "PARSE")
+            self.emit(indent, "try:")
+            self.emit(indent + 1, f"{parsed} = {parse}({raw})")
+            self.emit(indent, "except PARSE_ERRORS as parse_error:")
+            fail(indent + 1, f"parse_failure_message({prop_name}, {name}, {raw}, parse_error)")
+            self.emit(indent, "else:")
+            indent += 1
+        elif parsed != raw:
+            self.emit(indent, f"{parsed} = {raw}")
+
+        conditions = []
+
+        if not field_prop.nullable:
+            conditions.append((
+                f"{parsed} is None and {name} in body",
+                f"non_nullable_message({name})",
+            ))
+
+        types = self.constant(field_prop.types, "TYPES")
+        conditions.append((
+            f"{parsed} is not None and not isinstance({parsed}, {types})",
+            f"wrong_type_message({prop_name}, {name}, {parsed})",
+        ))
+
+        for position, (condition, expression) in enumerate(conditions):
+            self.emit(indent, f"{'if' if position == 0 else 'elif'} {condition}:")
+            fail(indent + 1, expression)
+
+        self.emit(indent, "else:")
+        indent += 1
+
+        if field_prop.validators:
+            validators = self.constant(tuple(field_prop.validators), "VALIDATORS")
+            prop_class = self.constant(type(field_prop), "CLASS")
+            self.emit(indent, f"error_message = check_validators({validators}, {prop_class}, {parsed})")
+            self.emit(indent, "if error_message is not None:")
+            fail(indent + 1, "error_message")
+            self.emit(indent, "else:")
+            indent += 1
+
+        succeed(indent)
+
+
+class OutputSchemaCompiler(SchemaCompiler):
+
+    function_name = "format_body"
+
+    def __init__(self, schema):
+        super().__init__(schema)
+        self.namespace["format_null_object"] = format_null_object
+
+    def compile(self):
+        self.emit(0, f"def {self.function_name}(body):")
+        self.emit(1, "returned_dict = {}")
+
+        for field_name, field_prop in self.schema.items():
+            name = self.constant(field_name, "NAME")
+            value = self.variable("value")
+
+            self.emit_keyed_value(1, field_prop, name, "body", value)
+
+            if field_prop.required is False:
+                self.emit(1, f"if {value} is not None:")
+                self.emit(2, f"returned_dict[{name}] = {value}")
+            else:
+                self.emit(1, f"returned_dict[{name}] = {value}")
+
+        self.emit(1, "return returned_dict")
+
+        return self.build("output schema")
+
+    def emit_keyed_value(self, indent, field_prop, name, body, target):
+        """Emit code that validates and formats body[name] into target."""
+
+        prop_name = self.constant(field_prop, "PROP")
+        kind = get_output_kind(field_prop)
+
+        if kind is None:
+            self.emit(indent, f"{target} = {prop_name}.format_output_and_validate({name}, {body})")
+            return
+
+        types = self.constant(field_prop.types, "TYPES")
+
+        self.emit(indent, f"if {name} in {body}:")
+        self.emit(indent + 1, f"{target} = {body}[{name}]")
+
+        if field_prop.nullable:
+            self.emit(indent + 1, f"if {target} is not None and not isinstance({target}, {types}):")
+        else:
+            self.emit(indent + 1, f"if {target} is None:")
+            self.emit(indent + 2, f"raise ValidationError(non_nullable_message({name}))")
+            self.emit(indent + 1, f"if not isinstance({target}, {types}):")
+
+        self.emit(indent + 2, f"raise ValidationError(wrong_type_message({prop_name}, {name}, {target}))")
+        self.emit(indent, "else:")
+
+        if field_prop.required:
+            self.emit(indent + 1, f"raise ValidationError(required_message({name}))")
+        else:
+            self.emit(indent + 1, f"{target} = None")
+
+        self.emit_format(indent, field_prop, kind, target)
+
+    def emit_element_value(self, indent, field_prop, item, target):
+        """Emit code that validates and formats an array element into target."""
+
+        prop_name = self.constant(field_prop, "PROP")
+        kind = get_output_kind(field_prop)
+
+        if kind is None:
+            self.emit(indent, f"{target} = {prop_name}.format_output_and_validate(None, None, {item})")
+            return
+
+        types = self.constant(field_prop.types, "TYPES")
+
+        self.emit(indent, f"{target} = {item}")
+        self.emit(indent, f"if {target} is not None and not isinstance({target}, {types}):")
+        self.emit(indent + 1, f"raise ValidationError(wrong_type_message({prop_name}, None, {target}))")
+
+        self.emit_format(indent, field_prop, kind, target)
+
+    def emit_format(self, indent, field_prop, kind, target):
+
+        if field_prop.validators:
+            validators = self.constant(tuple(field_prop.validators), "VALIDATORS")
+            prop_class = self.constant(type(field_prop), "CLASS")
+            self.emit(indent, f"error_message = check_validators({validators}, {prop_class}, {target})")
+            self.emit(indent, "if error_message is not None:")
+            self.emit(indent + 1, "raise ValidationError(error_message)")
+
+        if kind == "object":
+            self.emit_object(indent, field_prop, target)
+        elif kind == "array":
+            self.emit_array(indent, field_prop, target)
+        else:
+            self.emit_leaf_format(indent, field_prop, target)
+
+    def emit_leaf_format(self, indent, field_prop, target):
+        format_output = type(field_prop).format_output
+
+        if format_output is dos_prop.Prop.format_output:
+            return
+
+        if format_output is dos_prop.DateTime.format_output and not field_prop.native:
+            self.emit(indent, f"if {target} is not None:")
+            self.emit(indent + 1, f"{target} = str({target})")
+        elif format_output is dos_prop.Enum.format_output:
+            self.emit(indent, f"if {target} is not None:")
+            self.emit(indent + 1, f"{target} = str({target}.value)")
+        else:
+            self.emit(indent, f"{target} = {self.constant(field_prop.format_output, 'FORMAT')}({target})")
+
+    def emit_object(self, indent, field_prop, target):
+        structure = self.constant(field_prop.structure, "STRUCTURE")
+
+        self.emit(indent, f"if {target} is None:")
+        self.emit(indent + 1, f"{target} = format_null_object({structure})")
+        self.emit(indent, "else:")
+
+        entries = []
+
+        for field_name, nested_prop in field_prop.structure.items():
+            name = self.constant(field_name, "NAME")
+            value = self.variable("value")
+            self.emit_keyed_value(indent + 1, nested_prop, name, target, value)
+            entries.append(f"{name}: {value}")
+
+        self.emit(indent + 1, f"{target} = {{{', '.join(entries)}}}")
+
+    def emit_array(self, indent, field_prop, target):
+        items = self.variable("items")
+        item = self.variable("item")
+        value = self.variable("value")
+
+        self.emit(indent, f"{items} = []")
+        self.emit(indent, f"if {target}:")
+        self.emit(indent + 1, f"for {item} in {target}:")
+        self.emit_element_value(indent + 2, field_prop.repeated_structure, item, value)
+        self.emit(indent + 2, f"{items}.append({value})")
+        self.emit(indent, f"{target} = {items}")
@@ -0,0 +1,55 @@
+import collections
+import logging
+import threading
+import time
+
+LOGGER = logging.getLogger("dos")
+
+
+class RateLimitedFailureHook:  # pylint: disable=too-many-instance-attributes
+    """
+    The default parse failure hook. Counts every failure by prop class, and
+    logs the details of at most sample_size failures per interval seconds,
+    reporting how many were skipped once the interval is over.
+    """
+
+    def __init__(self, sample_size=10, interval=60.0, logger=LOGGER, clock=time.monotonic):
+        self.sample_size = sample_size
+        self.interval = interval
+        self.logger = logger
+        self.clock = clock
+        self.counts = collections.Counter()
+        self.lock = threading.Lock()
+        self.window_start = clock()
+        self.sampled = 0
+        self.skipped = 0
+
+    def __call__(self, prop, field_name, message, parse_error):
+        now = self.clock()
+
+        with self.lock:
+            self.counts[type(prop).__name__] += 1
+
+            skipped = 0
+            if now - self.window_start >= self.interval:
+                skipped = self.skipped
+                self.window_start = now
+                self.sampled = 0
+                self.skipped = 0
+
+            if self.sampled < self.sample_size:
+                self.sampled += 1
+                log_details = True
+            else:
+                self.skipped += 1
+                log_details = False
+
+        if skipped:
+            self.logger.warning("%s more parse failures were not logged", skipped)
+
+        if log_details:
+            self.logger.warning("%s /// Error: %s", message, parse_error)
+
+    def get_counts(self):
+        with self.lock:
+            return dict(self.counts)
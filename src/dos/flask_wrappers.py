@@ -1,9 +1,23 @@
+import itertools
+import json
+import re
+from collections.abc import Iterator
+from decimal import Decimal
 from functools import wraps
 from http import HTTPStatus
-from http.client import responses
+from types import MappingProxyType
+from uuid import uuid4
 
 from dos import prop
-from flask import request, jsonify
+from dos.compiler import compile_input_schema, compile_output_schema
+from dos.open_api import responses
+from dos.schema import FrozenSchema
+
+# Flask is imported when a wrapper is first created or used, rather than with
+# this module, so validate_input and create_output can be used without it.
+
+# How many elements of a streamed array are encoded into each response chunk.
+STREAM_CHUNK_SIZE = 1000
 
 
 def wrap_handler(name, func):
@@ -16,6 +30,7 @@ def wrap_handler(name, func):
 
 
 def wrap_route(app, func, rule, http_methods, *a, **kw):
+    from flask import Response, jsonify, stream_with_context  # pylint: disable=import-outside-toplevel
 
     kw = kw.copy()
 
@@ -34,7 +49,7 @@ def wrap_route(app, func, rule, http_methods, *a, **kw):
         if isinstance(func_response, dict):
             ret = func_response
             status = ret.get("status", HTTPStatus.OK)
-        if isinstance(func_response, tuple):
+        elif isinstance(func_response, tuple):
             ret = func_response[1]
 
             affiliated_response = responses.get(func_response[0])
@@ -46,6 +61,11 @@ def wrap_route(app, func, rule, http_methods, *a, **kw):
         else:
             raise Exception("Must be a dict or a tuple!")
 
+        if isinstance(ret, dict) and any(isinstance(value, ArrayStream) for value in ret.values()):
+            mimetype = getattr(app.json, "mimetype", "application/json")
+            resp = Response(stream_with_context(stream_json(ret)), mimetype=mimetype)
+            return resp, status
+
         resp = jsonify(ret)
         return resp, status
 
@@ -58,15 +78,47 @@ def wrap_route(app, func, rule, http_methods, *a, **kw):
 
 
 def wrap_validation(handler, module):
+    from flask import g, request  # pylint: disable=import-outside-toplevel
+
+    # Schemas are built once, when the endpoint is registered. A module that
+    # really needs a fresh schema per request can opt out with
+    # `dynamic_schema = True`.
+    dynamic_schema = getattr(module, "dynamic_schema", False)
+
+    # A module can decode its request bodies itself, e.g. with
+    # `json_loads = decimal_json_loads` to keep Number inputs exact.
+    json_loads = getattr(module, "json_loads", None)
+
+    has_input_schema = hasattr(module, "input_schema")
+    has_output_schema = hasattr(module, "output_schema")
+
+    frozen_input_schema = None
+    frozen_output_schema = None
+    input_validator = None
+    output_formatters = None
+
+    if not dynamic_schema:
+        if has_input_schema:
+            frozen_input_schema = freeze_schema(module.input_schema())
+            input_validator = compile_input_schema(frozen_input_schema)
+        if has_output_schema:
+            frozen_output_schema = freeze_output_schema(module.output_schema())
+            output_formatters = compile_output_schema(frozen_output_schema)
 
     def validation_wrapper(*a, **kw):
-        if hasattr(module, "input_schema"):
-            http_status, reject_dict = validate_input(request, module.input_schema())
+        if has_input_schema:
+            input_schema = module.input_schema() if dynamic_schema else frozen_input_schema
+            http_status, reject_dict, validated_input = validate_and_parse_input(
+                request, input_schema, input_validator, json_loads
+            )
             if http_status is not HTTPStatus.OK:
                 return http_status, reject_dict
 
-        if hasattr(module, "output_schema"):
-            return create_output(handler(*a, **kw), module.output_schema())
+            g.validated_input = validated_input
+
+        if has_output_schema:
+            output_schema = module.output_schema() if dynamic_schema else frozen_output_schema
+            return create_output(handler(*a, **kw), output_schema, output_formatters)
 
         return handler(*a, **kw)
 
@@ -74,66 +126,107 @@ def wrap_validation(handler, module):
     return validation_wrapper
 
 
-def validate_input(given_request, input_schema):  # pylint: disable=too-many-statements
+def freeze_schema(schema):
+    return FrozenSchema(schema)
+
+
+def freeze_output_schema(output_schema):
+    return MappingProxyType({
+        http_status: freeze_schema(schema) for http_status, schema in output_schema.items()
+    })
+
+
+def get_validated_input():
+    """
+    The request body parsed by the endpoint's input_schema (Decimals, Arrow
+    objects, nested structures), available to handlers wrapped by
+    wrap_validation.
+    """
+    from flask import g  # pylint: disable=import-outside-toplevel
+
+    return g.validated_input
+
+
+def decimal_json_loads(data):
+    """
+    json.loads, decoding JSON numbers with a fraction or exponent to
+    decimal.Decimal rather than float, so Number inputs keep the exact value
+    that was sent and don't need parsing again.
+    """
+    return json.loads(data, parse_float=Decimal)
+
+
+def decode_json_body(given_request, json_loads):
+    """Decode a JSON request body with json_loads in place of Flask's get_json."""
+    if not given_request.is_json:
+        return None
+
+    return json_loads(given_request.get_data(cache=True))
+
+
+def validate_input(given_request, input_schema, compiled_validator=None, json_loads=None):
+    http_status, reject_dict, _ = validate_and_parse_input(given_request, input_schema, compiled_validator, json_loads)
+    return http_status, reject_dict
+
+
+def validate_and_parse_input(given_request, input_schema, compiled_validator=None, json_loads=None):  # pylint: disable=too-many-statements
     message = []
     field_error_messages = {}
+    validated_input = {}
     http_status = HTTPStatus.OK
 
     body = given_request
     if not isinstance(body, dict):
         try:
-            body = given_request.get_json()
+            if json_loads is None:
+                body = given_request.get_json()
+            else:
+                body = decode_json_body(given_request, json_loads)
         except Exception:  # pylint: disable=broad-except
+            body = None
+
+        if not isinstance(body, dict):
             message.append("Improperly formatted request body. Must provide valid JSON, even if it's just {}!")
             http_status = HTTPStatus.PRECONDITION_FAILED
 
-    if http_status is HTTPStatus.OK:
+    if compiled_validator is not None and http_status is HTTPStatus.OK:
+        return compiled_validator(body)
 
-        expected_fields = []
-        required_fields = []
-
-        for field_name, field_prop in input_schema.items():
-            expected_fields.append(field_name)
-            if field_prop.required:
-                required_fields.append(field_name)
+    if http_status is HTTPStatus.OK:
 
-        unexpected_fields = []
+        if not isinstance(input_schema, FrozenSchema):
+            input_schema = FrozenSchema(input_schema)
 
-        for key in body.copy():
-            if key not in expected_fields:
-                unexpected_fields.append(key)
+        if not body.keys() <= input_schema.expected_fields:
+            unexpected_fields = [key for key in body if key not in input_schema.expected_fields]
 
-        if len(unexpected_fields) > 0:
             if len(unexpected_fields) == 1:
                 message.append(f"An unexpected field was sent to the server: {unexpected_fields[0]}")
-                http_status = HTTPStatus.BAD_REQUEST
             else:
                 message.append(f"Unexpected fields were sent to the server: {str(unexpected_fields)}")
-                http_status = HTTPStatus.BAD_REQUEST
 
-        missing_required_fields = []
+            http_status = HTTPStatus.BAD_REQUEST
 
-        for field in required_fields:
-            if field not in body.keys():
-                missing_required_fields.append(field)
+        if not body.keys() >= input_schema.required_field_set:
+            missing_required_fields = [field for field in input_schema.required_fields if field not in body]
 
-        if len(missing_required_fields) > 0:
             if len(missing_required_fields) == 1:
                 message.append(f"A required field is missing: {missing_required_fields[0]}")
-                http_status = HTTPStatus.BAD_REQUEST
             else:
                 message.append(f"Required fields are missing: {missing_required_fields}")
-                http_status = HTTPStatus.BAD_REQUEST
+
+            http_status = HTTPStatus.BAD_REQUEST
 
     if http_status is HTTPStatus.OK:
 
         for field_name, field_prop in input_schema.items():
-            try:
-                field_prop.parse_input_and_validate(field_name, body)
-            except prop.ValidationError as validation_error:
-                if validation_error is not None:
-                    field_error_messages[field_name] = str(validation_error.message)
-                    http_status = HTTPStatus.BAD_REQUEST
+            value, failure = field_prop.check_input(field_name, body)
+
+            if failure is not None:
+                field_error_messages.update(failure.get_field_error_messages(field_name))
+                http_status = HTTPStatus.BAD_REQUEST
+            elif field_name in body:
+                validated_input[field_name] = value
 
     reject_dict = {}
 
@@ -149,10 +242,19 @@ def validate_input(given_request, input_schema):  # pylint: disable=too-many-sta
 
         reject_dict["field_error_messages"] = field_error_messages
 
-    return http_status, reject_dict
+    if http_status is not HTTPStatus.OK:
+        validated_input = None
 
+    return http_status, reject_dict, validated_input
 
-def create_output(endpoint_result, output_schema):
+
+def create_output(endpoint_result, output_schema, compiled_formatters=None):
+    """
+    Validate and format a handler's (http status, body) result against the
+    output schema. An Array field whose value is an iterator (like a
+    generator) rather than a list comes back as an ArrayStream, validated and
+    formatted element by element as wrap_route streams it out.
+    """
 
     http_status_code = endpoint_result[0]
     result_body = endpoint_result[1]
@@ -161,10 +263,32 @@ def create_output(endpoint_result, output_schema):
     if output_dict_object is None:
         raise prop.ValidationError(f"Endpoint does not define http status code {http_status_code} in the output schema!")
 
+    streamed_fields = get_streamed_fields(output_dict_object, result_body)
+
+    # Formatters built by compile_output_schema only handle dict bodies.
+    if compiled_formatters is not None and isinstance(result_body, dict) and not streamed_fields:
+        formatter = compiled_formatters.get(http_status_code)
+        if formatter is not None:
+            return http_status_code, formatter(result_body)
+
+    if streamed_fields:
+        result_body = dict(result_body)
+
     returned_dict = {}
 
     for field_name, field_prop in output_dict_object.items():
-        value = field_prop.format_output_and_validate(field_name, result_body)
+        if field_name in streamed_fields:
+            if is_streamable_array(field_prop):
+                returned_dict[field_name] = ArrayStream(field_prop, result_body[field_name])
+                continue
+
+            # Array validators (like MaxItems) need every element at once.
+            result_body[field_name] = list(result_body[field_name])
+
+        value, failure = field_prop.check_output(field_name, result_body)
+
+        if failure is not None:
+            raise failure.to_error()
 
         if value is None and field_prop.required is False:
             continue
@@ -172,3 +296,130 @@ def create_output(endpoint_result, output_schema):
         returned_dict[field_name] = value
 
     return http_status_code, returned_dict
+
+
+def get_streamed_fields(output_dict_object, result_body):
+    # Frozen schemas (the ones wrap_validation uses) know their Array fields already.
+    if isinstance(output_dict_object, FrozenSchema):
+        array_fields = output_dict_object.array_fields
+    else:
+        array_fields = [
+            field_name for field_name, field_prop in output_dict_object.items() if isinstance(field_prop, prop.Array)
+        ]
+
+    if not array_fields or not isinstance(result_body, dict):
+        return ()
+
+    return {field_name for field_name in array_fields if isinstance(result_body.get(field_name), Iterator)}
+
+
+def is_streamable_array(field_prop):
+    prop_class = type(field_prop)
+
+    return (
+        not field_prop.validators and
+        prop_class.check_output is prop.Prop.check_output and
+        prop_class.format_output_and_validate is prop.Prop.format_output_and_validate and
+        prop_class.format_and_check is prop.Array.format_and_check
+    )
+
+
+class ArrayStream:
+    """
+    The output of an Array field whose handler returned an iterator. Each
+    element is validated and formatted by the Array's repeated_structure as it
+    is iterated, raising ValidationError for the first one that fails, so the
+    whole list is never held in memory. It can only be iterated once.
+    """
+
+    __slots__ = ("array_prop", "values")
+
+    def __init__(self, array_prop, values):
+        self.array_prop = array_prop
+        self.values = values
+
+    def __iter__(self):
+        element_prop = self.array_prop.repeated_structure
+
+        for value in self.values:
+            value, failure = element_prop.check_output(None, None, value)
+
+            if failure is not None:
+                raise failure.to_error()
+
+            yield value
+
+
+def stream_json(body, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Encode an output body in chunks as the same JSON text jsonify would send
+    with the app's JSON provider, compact or pretty printed, with each
+    ArrayStream encoded chunk_size elements at a time. A validation error in
+    a streamed element can only end the response early, since the status
+    has already been sent.
+    """
+    from flask import current_app  # pylint: disable=import-outside-toplevel
+
+    json_provider = current_app.json
+    compact = getattr(json_provider, "compact", None)
+
+    # The same choice jsonify makes between pretty printed and compact output.
+    if (compact is None and current_app.debug) or compact is False:
+        dump_args = {"indent": 2}
+    else:
+        dump_args = {"separators": (",", ":")}
+
+    # Encode the body with a placeholder list for each stream, then send the
+    # text around the placeholders as is, so keys are ordered and indented
+    # exactly as jsonify would.
+    # The placeholders include a random token, so data in the body (like an echoed client value) can't match one.
+    token = uuid4().hex
+    streams = {}
+    skeleton = {}
+
+    for field_name, value in body.items():
+        if isinstance(value, ArrayStream):
+            placeholder = f"dos array stream {token} {len(streams)}"
+            streams[json_provider.dumps(placeholder)] = value
+            value = [placeholder]
+
+        skeleton[field_name] = value
+
+    text = json_provider.dumps(skeleton, **dump_args)
+
+    if not streams:
+        yield text + "\n"
+        return
+
+    pieces = re.split("(" + "|".join(map(re.escape, streams)) + ")", text)
+    text_before = pieces[0]
+
+    for placeholder, text_after in zip(pieces[1::2], pieces[2::2]):
+        opening = text_before.rstrip()
+        # Empty for compact output, otherwise a newline and the element indentation.
+        element_break = text_before[len(opening):]
+        yield opening
+
+        elements = iter(streams[placeholder])
+        element_separator = element_break
+
+        while True:
+            chunk = list(itertools.islice(elements, chunk_size))
+            if not chunk:
+                break
+
+            if element_break:
+                encoded = ("," + element_break).join(
+                    json_provider.dumps(element, **dump_args).replace("\n", element_break) for element in chunk
+                )
+            else:
+                # Encoding the whole chunk as a list is one call, rather than one per element.
+                encoded = json_provider.dumps(chunk, **dump_args)[1:-1]
+
+            yield element_separator + encoded
+            element_separator = "," + element_break
+
+        # An empty array is "[]" in both compact and pretty printed output.
+        text_before = text_after if element_separator != element_break else text_after.lstrip()
+
+    yield text_before + "\n"
@@ -1,10 +1,13 @@
 import collections
 
-from http.client import responses
+from http import HTTPStatus
 
 from dos import prop as open_api_prop
 from dos import prop_wrapper as open_api_prop_wrapper
 
+# The same table as http.client.responses, without importing http.client (and with it email and ssl).
+responses = {http_status.value: http_status.phrase for http_status in HTTPStatus}
+
 
 class OpenAPI(collections.OrderedDict):
     def __init__(self, title, version, description=None):
@@ -104,10 +107,14 @@ class OpenAPI(collections.OrderedDict):
                         "oneOf": []
                     }
 
+                    object_references = []
+
                     for list_prop in prop.prop_list:
                         if list_prop.prop_type == open_api_prop.Object.prop_type:
                             full_suffix = suffix + "_" + name + "_object_" + str(object_iterator)
-                            dict_of_prop_wrapper_to_add["oneOf"].append(get_object_reference_dict(self, list_prop, full_suffix, path))
+                            object_reference = get_object_reference_dict(self, list_prop, full_suffix, path)
+                            object_references.append((list_prop, object_reference["$ref"]))
+                            dict_of_prop_wrapper_to_add["oneOf"].append(object_reference)
                             object_iterator += 1
                         elif list_prop.prop_type == open_api_prop.Array.prop_type:
                             full_suffix = suffix + "_" + name + "_array_" + str(array_iterator)
@@ -116,6 +123,15 @@ class OpenAPI(collections.OrderedDict):
                         else:
                             dict_of_prop_wrapper_to_add["oneOf"].append(get_prop_dict(list_prop))
 
+                    if prop.discriminator is not None:
+                        dict_of_prop_wrapper_to_add["discriminator"] = {
+                            "propertyName": prop.discriminator,
+                            "mapping": {
+                                str(tag): next(ref for list_prop, ref in object_references if list_prop is tagged_prop)
+                                for tag, tagged_prop in prop.mapping.items()
+                            },
+                        }
+
                     open_api_schema_dict[schema_name]["properties"][name] = dict_of_prop_wrapper_to_add
 
             else:
@@ -237,6 +253,9 @@ def get_prop_dict(prop):
     if prop.description is not None:
         dictionary["description"] = prop.description
 
+    for validator in prop.validators:
+        dictionary.update(validator.open_api_constraints())
+
     return dictionary
 
 
@@ -262,9 +281,8 @@ def get_array_dict(self, prop, suffix, path):
         nested_schema_name = self.add_schema(path, suffix, prop.repeated_structure)
         dict_of_prop_to_add["items"] = {"$ref": "#/components/schemas/" + nested_schema_name}
     else:
-        dict_of_prop_to_add["items"] = {
-            "type": str(prop.repeated_structure.prop_type.value) + "s"
-        }
+        # Primitive elements are described inline, with their own validator constraints.
+        dict_of_prop_to_add["items"] = get_prop_dict(prop.repeated_structure)
 
     return dict_of_prop_to_add
 
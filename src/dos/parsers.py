@@ -1,25 +1,46 @@
 import datetime
 import re
+import sys
 from decimal import Decimal, InvalidOperation
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
-import arrow
-import arrow.parser
+if TYPE_CHECKING:
+    import arrow
+
+# arrow is imported the first time a date needs it, see import_arrow.
+ARROW = None
+
+
+# Characters dropped from formatted numbers like "$1,000" or "12%", alongside whitespace.
+NUMBER_FORMATTING = str.maketrans("", "", "$,%")
+PARENTHESIZED_NUMBER = re.compile(r'\(\d+(\.\d+)?\)')
+# The ISO 8601 strings datetime.fromisoformat parses the same way arrow.get does: a "T" or space
+# between date and time, at most microseconds and an offset right after the time.
+ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}([T ]\d{2}(:\d{2}(:\d{2}([.,]\d{1,6})?)?)?(Z|[+-]\d{2}(:?\d{2})?)?)?', re.ASCII)
 
 
 def extract_number(val: Union[int, float, Decimal, str]) -> Decimal:
 
-    if isinstance(val, (int, float, Decimal)):
+    # Decimals are immutable, so one decoded from JSON (see decimal_json_loads) is used as is.
+    if type(val) is Decimal:  # pylint: disable=unidiomatic-typecheck
+        return val
+
+    if isinstance(val, float):
+        # repr gives the shortest string that round trips, so 0.1 becomes Decimal("0.1").
+        return Decimal(repr(val))
+
+    if isinstance(val, (int, Decimal)):
         return Decimal(val)
 
     val = str(val)
-    val = re.sub(r'([$,%]|\s)', "", val)
 
-    if val == "-":
-        val = "0"
+    # Plain numbers like "123.45" need no cleaning up.
+    try:
+        return Decimal(val)
+    except InvalidOperation:
+        pass
 
-    if re.search(r'^\(\d+(\.\d+)?\)$', val):
-        val = "-" + re.sub(r'[()]', "", val)
+    val = clean_number(val)
 
     try:
         return Decimal(val)
@@ -27,7 +48,78 @@ def extract_number(val: Union[int, float, Decimal, str]) -> Decimal:
         raise InvalidOperation(val)
 
 
-def extract_arrow(val: Union[str, int, datetime.datetime, arrow.Arrow]) -> arrow.Arrow:
+def extract_number_many(vals: list) -> list:
+    """
+    extract_number for a whole list, looking at the element types once. Lists
+    of ints, of floats or of plain number strings are converted in one pass;
+    anything else is parsed element by element.
+    """
+
+    val_types = set(map(type, vals))
+
+    if val_types == {Decimal}:
+        return list(vals)
+
+    if val_types <= {int, Decimal}:
+        return list(map(Decimal, vals))
+
+    if val_types == {float}:
+        return list(map(Decimal, map(repr, vals)))
+
+    if val_types == {str}:
+        try:
+            return list(map(Decimal, vals))
+        except InvalidOperation:
+            pass
+
+    return [extract_number(val) for val in vals]
+
+
+def extract_float(val: Union[int, float, Decimal, str]) -> float:
+
+    if isinstance(val, (int, float, Decimal)):
+        return float(val)
+
+    val = str(val)
+
+    try:
+        return float(val)
+    except ValueError:
+        pass
+
+    return float(clean_number(val))
+
+
+def clean_number(val: str) -> str:
+    """Strip currency, percent and thousands formatting, turning "(12.50)" into "-12.50"."""
+
+    val = "".join(val.translate(NUMBER_FORMATTING).split())
+
+    if val == "-":
+        return "0"
+
+    if val.startswith("(") and PARENTHESIZED_NUMBER.fullmatch(val):
+        return "-" + val[1:-1]
+
+    return val
+
+
+def import_arrow():
+    """Import arrow on first use, so `import dos` doesn't pay for it."""
+    global ARROW  # pylint: disable=global-statement
+
+    if ARROW is None:
+        import arrow  # pylint: disable=import-outside-toplevel,redefined-outer-name
+        import arrow.parser  # pylint: disable=import-outside-toplevel
+
+        ARROW = arrow
+
+    return ARROW
+
+
+def extract_arrow(val: Union[str, int, datetime.datetime, "arrow.Arrow"]) -> "arrow.Arrow":
+
+    arrow = import_arrow()  # pylint: disable=redefined-outer-name
 
     if isinstance(val, datetime.datetime):
         return arrow.get(val)
@@ -35,32 +127,34 @@ def extract_arrow(val: Union[str, int, datetime.datetime, arrow.Arrow]) -> arrow
     if isinstance(val, arrow.Arrow):
         return val
 
-    if isinstance(val, int):
-        val = str(val)
-        if not val.startswith("20"):
-            raise ValueError(
-                "Year must begin with 20 (value was {!r})"
-                .format(val)
-            )
-
-        if len(val) != 8:
-            raise ValueError(
-                "When parsing an integer as a date, it must have length 8, not "
-                "{} (value was {!r})"
-                .format(len(val), val)
-            )
-
-        return arrow.get("{}-{}-{}".format(val[0:4], val[4:6], val[6:8]))
-
-    val = val.strip()
+    # Integer dates like 20200701 are parsed like the string "20200701".
+    val = check_integer_date(val) if isinstance(val, int) else val.strip()
 
     if len(val) == 8 and val.isdigit():
         return arrow.get("{}-{}-{}".format(val[0:4], val[4:6], val[6:8]))
 
     if "/" in val:
-        parts = val.split("/")
-        parts = [p.zfill(2) for p in parts]
-        val = "/".join(parts)
+        return extract_us_arrow(val)
+
+    if is_iso_date(val):
+        try:
+            parsed = datetime.datetime.fromisoformat(val)
+        except ValueError:
+            pass
+        else:
+            return arrow.Arrow.fromdatetime(parsed, parsed.tzinfo)
+
+    return arrow.get(val)
+
+
+def extract_us_arrow(val: str) -> "arrow.Arrow":
+    """Parse a US style date like "7/1/2020" or "07/01/20", leaving anything else to arrow."""
+
+    arrow = import_arrow()  # pylint: disable=redefined-outer-name
+
+    parts = val.split("/")
+    parts = [p.zfill(2) for p in parts]
+    val = "/".join(parts)
 
     try:
         formats = [
@@ -71,3 +165,124 @@ def extract_arrow(val: Union[str, int, datetime.datetime, arrow.Arrow]) -> arrow
         return arrow.get(val, formats)
     except arrow.parser.ParserError:
         return arrow.get(val)
+
+
+def extract_arrow_many(vals: list) -> list:
+    """
+    extract_arrow for a whole list. When every element is an ISO 8601 string
+    they all go through datetime.fromisoformat in one pass; anything else is
+    parsed element by element.
+    """
+
+    arrow = import_arrow()  # pylint: disable=redefined-outer-name
+
+    if set(map(type, vals)) == {str}:
+        stripped = [val.strip() for val in vals]
+
+        if all(map(is_iso_date, stripped)):
+            fromdatetime = arrow.Arrow.fromdatetime
+
+            try:
+                return [fromdatetime(parsed, parsed.tzinfo) for parsed in map(datetime.datetime.fromisoformat, stripped)]
+            except ValueError:
+                pass
+
+    return [extract_arrow(val) for val in vals]
+
+
+def extract_datetime(val: Union[str, int, datetime.date, "arrow.Arrow"]) -> datetime.date:
+    """
+    Like extract_arrow, but producing stdlib values: a datetime.date for
+    date-only input (like "2020-07-01", "07/01/2020" or 20200701) and a
+    datetime.datetime otherwise, left naive unless the input has an offset.
+    Only unusual formats need arrow.
+    """
+
+    if isinstance(val, datetime.date):
+        return val
+
+    # A value can only be an Arrow if something already imported arrow.
+    loaded_arrow = sys.modules.get("arrow")
+    if loaded_arrow is not None and isinstance(val, loaded_arrow.Arrow):
+        return val.datetime
+
+    # Integer dates like 20200701 are parsed like the string "20200701".
+    val = check_integer_date(val) if isinstance(val, int) else val.strip()
+
+    if len(val) == 8 and val.isdigit():
+        return datetime.date(int(val[0:4]), int(val[4:6]), int(val[6:8]))
+
+    if "/" in val:
+        parsed = extract_us_date(val)
+        if parsed is not None:
+            return parsed
+
+    elif is_iso_date(val):
+        # Date-only strings stay dates.
+        fromisoformat = datetime.date.fromisoformat if len(val) == 10 else datetime.datetime.fromisoformat
+
+        try:
+            return fromisoformat(val)
+        except ValueError:
+            pass
+
+    return extract_arrow_datetime(val)
+
+
+def extract_arrow_datetime(val: str) -> datetime.date:
+    """
+    Parse anything else arrow understands for extract_datetime. Arrow's
+    parser leaves input without an offset naive, where arrow.get would make
+    it UTC, and input without a "T" or space separator has no time part.
+    """
+
+    parsed = import_arrow().parser.DateTimeParser().parse_iso(val)
+
+    if "T" not in val and " " not in val:
+        return parsed.date()
+
+    return parsed
+
+
+def extract_us_date(val: str) -> Union[datetime.date, None]:
+    """Parse a US style date like "7/1/2020" or "07/01/20", or return None."""
+
+    parts = [p.zfill(2) for p in val.split("/")]
+
+    for date_format in ("%m/%d/%Y", "%m/%d/%y"):
+        try:
+            return datetime.datetime.strptime("/".join(parts), date_format).date()
+        except ValueError:
+            pass
+
+    return None
+
+
+def check_integer_date(val: int) -> str:
+    val = str(val)
+    if not val.startswith("20"):
+        raise ValueError(
+            "Year must begin with 20 (value was {!r})"
+            .format(val)
+        )
+
+    if len(val) != 8:
+        raise ValueError(
+            "When parsing an integer as a date, it must have length 8, not "
+            "{} (value was {!r})"
+            .format(len(val), val)
+        )
+
+    return val
+
+
+def is_iso_date(val: str) -> bool:
+    """
+    Whether val is an extended ISO 8601 date or date and time
+    ("2020-07-01T10:00:00+01:00") that datetime.fromisoformat parses the same
+    way arrow does. fromisoformat is more lenient than arrow about separators
+    and offsets, and truncates fractional seconds past microseconds where
+    arrow rounds them, so anything else is left to arrow.
+    """
+
+    return ISO_DATE.fullmatch(val) is not None
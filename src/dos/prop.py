@@ -1,17 +1,21 @@
+import collections
+import datetime
 import decimal
-import logging
 import enum
+import itertools
+import reprlib
 
-import arrow
-
-from dos.parsers import extract_arrow, extract_number
-
-LOGGER = logging.getLogger()
-LOGGER.setLevel(logging.CRITICAL)
+from dos.cache import LRUCache
+from dos.failure_hooks import RateLimitedFailureHook
+from dos.parsers import (
+    extract_arrow, extract_arrow_many, extract_datetime, extract_float, extract_number, extract_number_many, import_arrow,
+)
 
 
 NO_VALUE = object()
 
+PARSE_ERRORS = (ValueError, TypeError, decimal.InvalidOperation)
+
 
 class OpenAPIPropType(enum.Enum):
     INTEGER = "integer"
@@ -23,26 +27,214 @@ class OpenAPIPropType(enum.Enum):
 
 
 class ValidationError(ValueError):
-    def __init__(self, message):
+    def __init__(self, message, field_errors=None):
+        if isinstance(message, ErrorMessage):
+            message = str(message)
+
         super().__init__(message)
         self.message = message
+        # Errors nested inside Object and Array inputs, keyed by their path (e.g. "items[3].name").
+        self.field_errors = field_errors
+
+    def get_field_error_messages(self, field_name):
+        return get_field_error_messages(self, field_name)
+
+
+class ValidationFailure:
+    """
+    The value returned, rather than raised, by the check_* methods when
+    validation fails. Matching exceptions are only built by the raising API.
+    """
+
+    __slots__ = ("message", "field_errors")
+
+    def __init__(self, message, field_errors=None):
+        self.message = message
+        self.field_errors = field_errors
+
+    def get_field_error_messages(self, field_name):
+        return get_field_error_messages(self, field_name)
+
+    def to_error(self):
+        return ValidationError(self.message, self.field_errors)
+
+
+def get_field_error_messages(error, field_name):
+    if error.field_errors:
+        return {path: str(message) for path, message in error.field_errors.items()}
+
+    return {field_name: str(error.message)}
+
+
+def capture_failure(method, *args):
+    """Call a raising validation method and return its (value, failure) result."""
+    try:
+        return method(*args), None
+    except ValidationError as validation_error:
+        return None, ValidationFailure(validation_error.message, validation_error.field_errors)
+
+
+def raise_failure(result):
+    """Turn a (value, failure) result back into the raising API."""
+    value, failure = result
+
+    if failure is not None:
+        raise failure.to_error()
+
+    return value
+
+
+class ErrorMessage:
+    """
+    An error message that is only formatted when it's turned into a string,
+    so messages that end up discarded (like those from a OneOf alternative
+    before another one matches) never pay for formatting their values.
+    """
+
+    __slots__ = ("template", "args")
+
+    def __init__(self, template, *args):
+        self.template = template
+        self.args = args
+
+    def __str__(self):
+        return self.template.format(*self.args)
+
+    def __repr__(self):
+        return f"ErrorMessage({str(self)!r})"
+
+
+class ValueRepr:
+    """Formats as the repr of value, cut down to at most max_length characters."""
+
+    __slots__ = ("value",)
+
+    max_length = 200
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return bound_length(value_repr(self.value, self.max_length), self.max_length)
+
+
+class ValueStr(ValueRepr):
+    """Formats as the str of value, cut down to at most max_length characters."""
+
+    __slots__ = ()
+
+    def __str__(self):
+        if isinstance(self.value, (list, tuple, dict, set)):
+            return super().__str__()
+
+        return bound_length(str(self.value), self.max_length)
+
+
+BOUNDED_REPRS = {}
+
+
+def value_repr(value, max_length):
+    if type(value) is str and len(value) < max_length:  # pylint: disable=unidiomatic-typecheck
+        return repr(value)
+
+    bounded_repr = BOUNDED_REPRS.get(max_length)
+
+    if bounded_repr is None:
+        bounded_repr = reprlib.Repr()
+        bounded_repr.maxstring = max_length
+        bounded_repr.maxlong = max_length
+        bounded_repr.maxother = max_length
+        BOUNDED_REPRS[max_length] = bounded_repr
+
+    return bounded_repr.repr(value)
+
+
+def bound_length(text, max_length):
+    if len(text) <= max_length:
+        return text
+
+    return text[:max_length - 3] + "..."
+
+
+def required_message(field_name):
+    return f"The field '{field_name}' is required but not found in the body!"
+
+
+def non_nullable_message(field_name):
+    return f"Non nullable field '{field_name}' is null!"
+
+
+def wrong_type_message(prop, field_name, prop_value):
+    return ErrorMessage(
+        "The value {} from field '{}' is the wrong type, expected: {}",
+        ValueRepr(prop_value),
+        field_name,
+        prop.__class__.__name__,
+    )
+
+
+# Called as parse_failure_hook(prop, field_name, message, parse_error) whenever a value can't be parsed.
+parse_failure_hook = RateLimitedFailureHook()
+
+
+def set_parse_failure_hook(hook):
+    """Replace the parse failure hook, or turn it off with None."""
+    global parse_failure_hook  # pylint: disable=global-statement
+    parse_failure_hook = hook
+
+
+def parse_failure_message(prop, field_name, prop_value, parse_error):
+    error = wrong_type_message(prop, field_name, prop_value)
+
+    if parse_failure_hook is not None:
+        parse_failure_hook(prop, field_name, error, ValueStr(parse_error))
+
+    return error
 
 
 class Prop:
+    """
+    Props are immutable once constructed, so a single instance can be shared
+    between schemas, requests and threads. Use evolve() to get a changed copy.
+    """
+
+    __slots__ = ("description", "required", "nullable", "validators")
+
+    # Slots are set with object.__setattr__, so they are declared here for linters.
+    description: str
+    required: bool
+    nullable: bool
+    validators: tuple
+
+    # The constructor arguments evolve() carries over to the new prop.
+    init_arguments = ("description", "required", "nullable", "validators")
 
     def __init__(self, description=None, required=True, nullable=False, validators=None):
-        self.description = description
-        self.required = required
-        self.nullable = nullable
-        self.validators = validators
+        object.__setattr__(self, "description", description)
+        object.__setattr__(self, "required", required)
+        object.__setattr__(self, "nullable", nullable)
+        object.__setattr__(self, "validators", bind_validators(validators, type(self)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable, use evolve() to change {name!r}!")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is immutable, use evolve() to change {name!r}!")
+
+    def __copy__(self):
+        return self
 
     def __deepcopy__(self, memo):  # pylint: disable=unused-argument
-        return type(self)(
-            description=self.description,
-            required=self.required,
-            nullable=self.nullable,
-            validators=self.validators
-        )
+        return self
+
+    def __reduce__(self):
+        # Slots can't be restored through __setattr__, so pickle rebuilds the prop from its arguments.
+        return rebuild_prop, (type(self), {name: getattr(self, name) for name in self.init_arguments})
+
+    def evolve(self, **changes):
+        arguments = {name: getattr(self, name) for name in self.init_arguments}
+        arguments.update(changes)
+        return type(self)(**arguments)
 
     def parse_input(self, prop_value):  # pylint: disable=no-self-use
         return prop_value
@@ -50,22 +242,56 @@ class Prop:
     def format_output(self, prop_value):  # pylint: disable=no-self-use
         return prop_value
 
-    def parse_input_and_validate(self, input_structure_field_name, body, prop_value=NO_VALUE):
+    def parse_many(self, prop_values):
+        """
+        Parse every element of an array at once, or return None when there is
+        no batched way to, so the elements are parsed one at a time. Parse
+        errors are raised as from parse_input.
+        """
+        if type(self).parse_input is Prop.parse_input:
+            return prop_values
+
+        return None
+
+    # The check_* methods are the result-returning validation API: they return
+    # (value, None) on success and (None, ValidationFailure) on failure. The
+    # parse_input_and_validate, format_output_and_validate and validate
+    # methods are thin raising wrappers around them. Subclasses that still
+    # override one of the raising methods are honoured by the check_* methods.
+
+    def check_input(self, input_structure_field_name, body, prop_value=NO_VALUE):
+        if type(self).parse_input_and_validate is not Prop.parse_input_and_validate:
+            return capture_failure(self.parse_input_and_validate, input_structure_field_name, body, prop_value)
+
+        return self.parse_and_check(input_structure_field_name, body, prop_value)
+
+    def check_output(self, output_structure_field_name, body, prop_value=NO_VALUE):
+        if type(self).format_output_and_validate is not Prop.format_output_and_validate:
+            return capture_failure(self.format_output_and_validate, output_structure_field_name, body, prop_value)
+
+        return self.format_and_check(output_structure_field_name, body, prop_value)
+
+    def check(self, output_structure_field_name, body, prop_value):
+        if type(self).validate is not Prop.validate:
+            return capture_failure(self.validate, output_structure_field_name, body, prop_value)
+
+        return self.check_constraints(output_structure_field_name, body, prop_value)
+
+    def parse_and_check(self, input_structure_field_name, body, prop_value=NO_VALUE):
 
         if prop_value is NO_VALUE:
             prop_value = body.get(input_structure_field_name)
 
         try:
             prop_value = self.parse_input(prop_value)
-        except (ValueError, TypeError, decimal.InvalidOperation) as ambiguous_error:
-            error = (f"The value {prop_value!r} from field '{input_structure_field_name}' "
-                     f"is the wrong type, expected: {self.__class__.__name__}")
-            LOGGER.critical(error + " /// Error: " + str(ambiguous_error))  # pylint: disable=logging-not-lazy
-            raise ValidationError(error)
+        except PARSE_ERRORS as ambiguous_error:
+            return None, ValidationFailure(
+                parse_failure_message(self, input_structure_field_name, prop_value, ambiguous_error)
+            )
 
-        return self.validate(input_structure_field_name, body, prop_value)
+        return self.check(input_structure_field_name, body, prop_value)
 
-    def format_output_and_validate(self, output_structure_field_name, body, prop_value=NO_VALUE):
+    def format_and_check(self, output_structure_field_name, body, prop_value=NO_VALUE):
 
         if prop_value is NO_VALUE:
             if body is None:
@@ -73,47 +299,80 @@ class Prop:
             else:
                 prop_value = body.get(output_structure_field_name)
 
-        prop_value = self.validate(output_structure_field_name, body, prop_value)
+        prop_value, failure = self.check(output_structure_field_name, body, prop_value)
 
-        return self.format_output(prop_value)
+        if failure is not None:
+            return None, failure
 
-    def validate(self, output_structure_field_name, body, prop_value):
+        return self.format_output(prop_value), None
+
+    def check_constraints(self, output_structure_field_name, body, prop_value):
 
         if self.required:
             if output_structure_field_name is not None and body is not None:
                 if output_structure_field_name not in body:
-                    raise ValidationError(
-                        f"The field '{output_structure_field_name}' is required "
-                        f"but not found in the body!"
-                    )
+                    return None, ValidationFailure(required_message(output_structure_field_name))
 
         if not self.nullable:
             if body is not None:
                 if output_structure_field_name in body:
                     if prop_value is None:
-                        raise ValidationError(
-                            f"Non nullable field '{output_structure_field_name}' "
-                            f"is null!"
-                        )
+                        return None, ValidationFailure(non_nullable_message(output_structure_field_name))
 
         if prop_value is not None:
             if not isinstance(prop_value, self.types):  # pylint: disable=no-member
-                raise ValidationError(
-                    f"The value {prop_value!r} from field '{output_structure_field_name}' "
-                    f"is the wrong type, expected: {self.__class__.__name__}"
-                )
+                return None, ValidationFailure(wrong_type_message(self, output_structure_field_name, prop_value))
 
-        if self.validators is not None:
+        if self.validators:
             for validator in self.validators:
-                error_message = validator.validate_prop(prop_class=type(self), prop_value=prop_value)
+                try:
+                    error_message = validator.validate_prop(prop_class=type(self), prop_value=prop_value)
+                except ValidationError as validation_error:
+                    error_message = validation_error.message
+
                 if error_message is not None:
-                    raise ValidationError(error_message)
+                    return None, ValidationFailure(error_message)
+
+        return prop_value, None
+
+    def parse_input_and_validate(self, input_structure_field_name, body, prop_value=NO_VALUE):
+        return raise_failure(self.parse_and_check(input_structure_field_name, body, prop_value))
+
+    def format_output_and_validate(self, output_structure_field_name, body, prop_value=NO_VALUE):
+        return raise_failure(self.format_and_check(output_structure_field_name, body, prop_value))
+
+    def validate(self, output_structure_field_name, body, prop_value):
+        return raise_failure(self.check_constraints(output_structure_field_name, body, prop_value))
 
-        return prop_value
+
+def rebuild_prop(prop_class, arguments):
+    """Unpickle a prop by constructing it again, see Prop.__reduce__."""
+    return prop_class(**arguments)
+
+
+def bind_validators(validators, prop_class):
+    """
+    Normalize validators to a tuple, accepting a single validator too, and
+    check each one supports prop_class, so an incompatible validator fails
+    when the schema is defined instead of on every value.
+    """
+
+    if validators is None:
+        return ()
+
+    if not isinstance(validators, (list, tuple)):
+        validators = (validators,)
+
+    for validator in validators:
+        validator.bind(prop_class)
+
+    return tuple(validators)
 
 
 class Integer(Prop):
 
+    __slots__ = ()
+
     prop_type = OpenAPIPropType.INTEGER
     types = int
 
@@ -125,49 +384,131 @@ class Integer(Prop):
 
 
 class Number(Prop):
+    """
+    Parses input to decimal.Decimal, or to float with as_float=True for
+    endpoints that don't need exact decimal arithmetic.
+    """
+
+    __slots__ = ("as_float",)
+
+    as_float: bool
+
+    init_arguments = Prop.init_arguments + ("as_float",)
 
     prop_type = OpenAPIPropType.NUMBER
     types = (int, float, decimal.Decimal)
 
+    def __init__(self, description=None, required=True, nullable=False, validators=None, as_float=False):
+        super().__init__(description=description, required=required, nullable=nullable, validators=validators)
+        object.__setattr__(self, "as_float", as_float)
+
     def parse_input(self, prop_value):
         if prop_value is None:
             return None
 
+        if self.as_float:
+            return extract_float(prop_value)
+
         return extract_number(prop_value)
 
+    def parse_many(self, prop_values):
+        if type(self).parse_input is not Number.parse_input or self.as_float:
+            return None
+
+        return extract_number_many(prop_values)
+
 
 class Numeric(Number):
 
+    __slots__ = ()
+
     types = (int, float, decimal.Decimal, str)
 
 
 class String(Prop):
 
+    __slots__ = ()
+
     prop_type = OpenAPIPropType.STRING
     types = str
     format = None
 
 
 class DateTime(String):
+    """
+    Parses input to arrow.Arrow and formats output with str(). With
+    native=True, input is parsed to datetime.date or datetime.datetime
+    instead, and output is formatted with isoformat().
+
+    With cache_size, the most recently parsed strings and integers are kept
+    in a per-prop LRU cache, for endpoints that get the same dates over and
+    over. Parsed values are never changed in place, so they can be shared.
+    """
+
+    __slots__ = ("native", "cache_size", "parse_cache")
+
+    native: bool
+    cache_size: int
+    parse_cache: LRUCache
+
+    init_arguments = String.init_arguments + ("native", "cache_size")
 
-    types = (str, arrow.Arrow)
     format = "date-time"
 
+    def __init__(
+        self, description=None, required=True, nullable=False, validators=None, *, native=False, cache_size=None,
+    ):
+        super().__init__(description=description, required=required, nullable=nullable, validators=validators)
+        object.__setattr__(self, "native", native)
+        object.__setattr__(self, "cache_size", cache_size)
+        object.__setattr__(self, "parse_cache", LRUCache(cache_size) if cache_size is not None else None)
+
+    @property
+    def types(self):
+        if self.native:
+            return (str, datetime.date)
+
+        # Only non-native props need arrow, so it's imported here rather than with the module.
+        return (str, import_arrow().Arrow)
+
     def parse_input(self, prop_value):
         if prop_value is None:
             return None
 
-        return extract_arrow(prop_value)
+        extract = extract_datetime if self.native else extract_arrow
+
+        if self.parse_cache is not None and type(prop_value) in (str, int):
+            return self.parse_cache.get_or_create(prop_value, lambda: extract(prop_value))
+
+        return extract(prop_value)
+
+    def parse_many(self, prop_values):
+        if type(self).parse_input is not DateTime.parse_input or self.native or self.parse_cache is not None:
+            return None
+
+        return extract_arrow_many(prop_values)
 
     def format_output(self, prop_value):
         if prop_value is None:
             return None
 
+        if self.native and not isinstance(prop_value, str):
+            return prop_value.isoformat()
+
         return str(prop_value)
 
+    def cache_info(self):
+        """Hit and miss counts for the parse cache, or None without one."""
+        if self.parse_cache is None:
+            return None
+
+        return self.parse_cache.info()
+
 
 class Enum(String):
 
+    __slots__ = ()
+
     types = enum.Enum
 
     def format_output(self, prop_value):
@@ -179,70 +520,220 @@ class Enum(String):
 
 class Boolean(Prop):
 
+    __slots__ = ()
+
     prop_type = OpenAPIPropType.BOOLEAN
     types = bool
 
 
 class Object(Prop):
 
+    __slots__ = ("structure",)
+
+    structure: dict
+
+    init_arguments = Prop.init_arguments + ("structure",)
+
     prop_type = OpenAPIPropType.OBJECT
     types = dict
 
     def __init__(self, structure, description=None, required=True, nullable=False, validators=None):
         super().__init__(description=description, required=required, nullable=nullable, validators=validators)
-        self.structure = structure
+        object.__setattr__(self, "structure", structure)
 
-    def __deepcopy__(self, memo):  # pylint: disable=unused-argument
-        return Object(
-            self.structure,
-            description=self.description,
-            required=self.required,
-            nullable=self.nullable,
-        )
+    def parse_and_check(self, input_structure_field_name, body, prop_value=NO_VALUE):
+        prop_value, failure = super().parse_and_check(input_structure_field_name, body, prop_value)
 
-    def format_output_and_validate(self, output_structure_field_name, body, prop_value=NO_VALUE):
-        prop_value = super().format_output_and_validate(
-            output_structure_field_name,
-            body,
-            prop_value,
-        )
+        if failure is not None or prop_value is None:
+            return prop_value, failure
+
+        return parse_nested_input(self, input_structure_field_name, prop_value)
+
+    def format_and_check(self, output_structure_field_name, body, prop_value=NO_VALUE):
+        prop_value, failure = super().format_and_check(output_structure_field_name, body, prop_value)
+
+        if failure is not None:
+            return None, failure
 
         validated_dict = {}
 
         for field_name, field_prop in self.structure.items():
-            validated_dict[field_name] = field_prop.format_output_and_validate(field_name, prop_value)
+            value, failure = field_prop.check_output(field_name, prop_value)
 
-        return validated_dict
+            if failure is not None:
+                return None, failure
+
+            validated_dict[field_name] = value
+
+        return validated_dict, None
 
 
 class Array(Prop):
 
+    __slots__ = ("repeated_structure",)
+
+    repeated_structure: Prop
+
+    init_arguments = Prop.init_arguments + ("repeated_structure",)
+
     prop_type = OpenAPIPropType.ARRAY
     types = list
 
     def __init__(self, repeated_structure, description=None, required=True, nullable=False, validators=None):
         super().__init__(description=description, required=required, nullable=nullable, validators=validators)
-        self.repeated_structure = repeated_structure
+        object.__setattr__(self, "repeated_structure", repeated_structure)
 
-    def __deepcopy__(self, memo):  # pylint: disable=unused-argument
-        return Array(
-            self.repeated_structure,
-            description=self.description,
-            required=self.required,
-            nullable=self.nullable,
-        )
+    def parse_and_check(self, input_structure_field_name, body, prop_value=NO_VALUE):
+        prop_value, failure = super().parse_and_check(input_structure_field_name, body, prop_value)
 
-    def format_output_and_validate(self, output_structure_field_name, body, prop_value=NO_VALUE):
-        prop_value = super().format_output_and_validate(
-            output_structure_field_name,
-            body,
-            prop_value,
-        )
+        if failure is not None or prop_value is None:
+            return prop_value, failure
+
+        return parse_nested_input(self, input_structure_field_name, prop_value)
+
+    def format_and_check(self, output_structure_field_name, body, prop_value=NO_VALUE):
+        prop_value, failure = super().format_and_check(output_structure_field_name, body, prop_value)
+
+        if failure is not None:
+            return None, failure
 
         validated_list = []
 
         if prop_value:
             for value in prop_value:
-                validated_list.append(self.repeated_structure.format_output_and_validate(None, None, value))
+                value, failure = self.repeated_structure.check_output(None, None, value)
+
+                if failure is not None:
+                    return None, failure
+
+                validated_list.append(value)
+
+        return validated_list, None
+
+
+def is_nested_input_container(field_prop):
+    prop_class = type(field_prop)
+
+    return (
+        prop_class.parse_and_check in (Object.parse_and_check, Array.parse_and_check) and
+        prop_class.parse_input_and_validate is Prop.parse_input_and_validate
+    )
+
+
+def parse_nested_input(root_prop, root_path, root_value):
+    """
+    Validate and parse everything inside an Object or Array input value in a
+    single breadth-first pass, without recursing, so deeply nested payloads
+    can't hit the recursion limit. Returns a parsed copy of root_value, or a
+    ValidationFailure whose field_errors are keyed by path (e.g. "items[3].name")
+    in document order. Nested values are named by their path in error messages.
+    """
+
+    field_errors = {}
+    # The position of each error in the document, as the index of every field or element on its path.
+    error_positions = {}
+    root_result = {} if isinstance(root_prop, Object) else []
+    pending = collections.deque([(root_prop, root_path, root_value, root_result, ())])
+
+    def parse_child(child_prop, child_path, child_body, child_value, position):
+        # Prop wrappers like OneOf aren't Props, and check their alternatives themselves.
+        if isinstance(child_prop, Prop) and is_nested_input_container(child_prop):
+            # Only check the container itself here; its contents are queued.
+            child_value, failure = Prop.parse_and_check(child_prop, child_path, child_body, child_value)
+        else:
+            return_value, failure = child_prop.check_input(child_path, child_body, child_value)
+            if failure is None:
+                return return_value
+
+        if failure is not None:
+            field_errors[child_path] = failure.message
+            error_positions[child_path] = position
+            return None
+
+        if child_value is None:
+            return None
+
+        child_result = {} if isinstance(child_prop, Object) else []
+        pending.append((child_prop, child_path, child_value, child_result, position))
+        return child_result
+
+    while pending:
+        container_prop, path, value, result, container_position = pending.popleft()
+
+        if isinstance(container_prop, Object):
+            for index, (field_name, field_prop) in enumerate(container_prop.structure.items()):
+                field_path = f"{path}.{field_name}"
+                # The field is looked up by its path, so checks and messages name it in full.
+                field_body = {field_path: value[field_name]} if field_name in value else {}
+                parsed = parse_child(
+                    field_prop, field_path, field_body, value.get(field_name), container_position + (index,)
+                )
+
+                if field_body:
+                    result[field_name] = parsed
+        else:
+            element_prop = container_prop.repeated_structure
+
+            parsed_elements = parse_primitive_elements(element_prop, value)
+            if parsed_elements is not None:
+                result.extend(parsed_elements)
+                continue
+
+            for index, element in enumerate(value):
+                element_path = f"{path}[{index}]"
+                result.append(parse_child(element_prop, element_path, None, element, container_position + (index,)))
+
+    if field_errors:
+        field_errors = {path: field_errors[path] for path in sorted(field_errors, key=error_positions.__getitem__)}
+        return None, ValidationFailure(next(iter(field_errors.values())), field_errors)
+
+    return root_result, None
+
+
+def parse_primitive_elements(element_prop, elements):
+    """
+    The batched path for arrays of primitives: parse the elements with
+    element_prop.parse_many and run each validator's validate_many. Returns
+    None if that isn't possible or anything fails, so the elements are checked
+    one at a time and the errors are the same as without it.
+    """
+
+    if not elements or not isinstance(element_prop, Prop) or not has_default_element_checks(type(element_prop)):
+        return None
+
+    try:
+        parsed_elements = element_prop.parse_many(elements)
+    except PARSE_ERRORS:
+        return None
+
+    if parsed_elements is None or not passes_element_checks(element_prop, parsed_elements):
+        return None
+
+    return parsed_elements
+
+
+def passes_element_checks(element_prop, parsed_elements):
+    if not all(map(isinstance, parsed_elements, itertools.repeat(element_prop.types))):
+        return False
+
+    for validator in element_prop.validators:
+        try:
+            error_messages = validator.validate_many(type(element_prop), parsed_elements)
+        except ValidationError:
+            return False
+
+        if any(error_message is not None for error_message in error_messages):
+            return False
+
+    return True
+
 
-        return validated_list
+def has_default_element_checks(prop_class):
+    return (
+        prop_class.parse_input_and_validate is Prop.parse_input_and_validate and
+        prop_class.check_input is Prop.check_input and
+        prop_class.parse_and_check is Prop.parse_and_check and
+        prop_class.check is Prop.check and
+        prop_class.validate is Prop.validate and
+        prop_class.check_constraints is Prop.check_constraints
+    )
@@ -1,6 +1,7 @@
+import copy
 import enum
 
-from dos.prop import Prop, NO_VALUE, ValidationError
+from dos.prop import Array, ErrorMessage, Object, Prop, NO_VALUE, ValidationFailure, ValueRepr, raise_failure
 
 
 class OpenAPIPropWrapperType(enum.Enum):
@@ -31,47 +32,214 @@ class PropWrapper:
 
         self._prop_list = props  # pylint: disable=attribute-defined-outside-init
 
+    def evolve(self, **changes):
+        evolved = copy.copy(self)
+
+        for name, value in changes.items():
+            setattr(evolved, name, value)
+
+        return evolved
+
 
 class OneOf(PropWrapper):
+    """
+    Accepts a value matching any one of prop_list. With a discriminator, the
+    alternatives are Objects picked by the value of their discriminator
+    field, using mapping from each tag to its Object. prop_list then defaults
+    to the Objects in mapping.
+    """
+
     prop_wrapper_type = OpenAPIPropWrapperType.ONE_OF
 
-    def parse_input_and_validate(self, input_structure_field_name, body, prop_value=NO_VALUE):
+    def __init__(self, prop_list=None, discriminator=None, mapping=None):
+        if (discriminator is None) != (mapping is None):
+            raise ValueError("discriminator and mapping must be given together!!")
+
+        if prop_list is None:
+            if mapping is None:
+                raise ValueError("prop_list must be a list!!")
+            prop_list = list(mapping.values())
+
+        super().__init__(prop_list)
+
+        if mapping is not None:
+            for tagged_prop in mapping.values():
+                if not any(tagged_prop is prop for prop in prop_list):
+                    raise ValueError("mapping must only contain props from prop_list!!")
+
+                if not isinstance(tagged_prop, Object) or discriminator not in tagged_prop.structure:
+                    raise ValueError(f"mapping must only contain Objects with a '{discriminator}' field!!")
+
+        self.discriminator = discriminator
+        self.mapping = mapping
+
+    @PropWrapper.prop_list.setter
+    def prop_list(self, props):
+        PropWrapper.prop_list.fset(self, props)
+
+        # For check_input and check_output, maps the type of a value to the positions of the props that could
+        # accept it. Only values whose type matches more than one prop have to try several of them.
+        self._dispatch_tables = {
+            method_name: build_dispatch_table(props, accepts_type) for method_name, accepts_type in ACCEPTS_TYPE.items()
+        }
+
+    def check_input(self, input_structure_field_name, body, prop_value=NO_VALUE):
 
         if prop_value is NO_VALUE:
             prop_value = body.get(input_structure_field_name)
 
-        error_message_list = []
+        if self.discriminator is not None and isinstance(prop_value, dict):
+            return self.dispatch_tagged("check_input", input_structure_field_name, body, prop_value)
 
-        for prop in self.prop_list:
-            try:
-                return prop.parse_input_and_validate(input_structure_field_name, body, prop_value)
-            except ValidationError as validation_error:
-                error_message_list.append(validation_error.message)
+        return self.dispatch("check_input", input_structure_field_name, body, prop_value)
 
-        raise ValidationError(get_one_of_error_message(error_message_list, prop_value, input_structure_field_name))
-
-    def format_output_and_validate(self, output_structure_field_name, body, prop_value=NO_VALUE):
+    def check_output(self, output_structure_field_name, body, prop_value=NO_VALUE):
 
         if prop_value is NO_VALUE:
             prop_value = body.get(output_structure_field_name)
 
+        if self.discriminator is not None and isinstance(prop_value, dict):
+            return self.dispatch_tagged("check_output", output_structure_field_name, body, prop_value)
+
+        return self.dispatch("check_output", output_structure_field_name, body, prop_value)
+
+    def dispatch_tagged(self, method_name, field_name, body, prop_value):
+        tag = prop_value.get(self.discriminator)
+
+        try:
+            tagged_prop = self.mapping.get(tag)
+        except TypeError:
+            tagged_prop = None
+
+        if tagged_prop is None:
+            return None, ValidationFailure(get_unknown_tag_message(tag, self.discriminator, field_name, self.mapping))
+
+        return getattr(tagged_prop, method_name)(field_name, body, prop_value)
+
+    def dispatch(self, method_name, field_name, body, prop_value):
+        dispatch_table = self._dispatch_tables[method_name]
+        value_type = type(prop_value)
+        candidates = dispatch_table.get(value_type)
+
+        if candidates is None:
+            candidates = get_candidates(self.prop_list, ACCEPTS_TYPE[method_name], value_type)
+            dispatch_table[value_type] = candidates
+
+        failure_messages = {}
+
+        for index in candidates:
+            value, failure = getattr(self.prop_list[index], method_name)(field_name, body, prop_value)
+
+            if failure is None:
+                return value, None
+
+            failure_messages[index] = failure.message
+
+        # Props that were skipped are still asked why they reject the value, so the message lists every prop.
         error_message_list = []
 
-        for prop in self.prop_list:
-            try:
-                return prop.format_output_and_validate(output_structure_field_name, body, prop_value)
-            except ValidationError as validation_error:
-                error_message_list.append(validation_error.message)
+        for index, prop in enumerate(self.prop_list):
+            if index not in failure_messages:
+                failure_messages[index] = getattr(prop, method_name)(field_name, body, prop_value)[1].message
 
-        raise ValidationError(get_one_of_error_message(error_message_list, prop_value, output_structure_field_name))
+            error_message_list.append(failure_messages[index])
+
+        return None, ValidationFailure(get_one_of_error_message(error_message_list, prop_value, field_name))
+
+    def parse_input_and_validate(self, input_structure_field_name, body, prop_value=NO_VALUE):
+        return raise_failure(self.check_input(input_structure_field_name, body, prop_value))
+
+    def format_output_and_validate(self, output_structure_field_name, body, prop_value=NO_VALUE):
+        return raise_failure(self.check_output(output_structure_field_name, body, prop_value))
+
+
+NoneType = type(None)
+
+JSON_TYPES = (NoneType, bool, int, float, str, list, dict)
+
+
+def build_dispatch_table(props, accepts_type):
+    return {value_type: get_candidates(props, accepts_type, value_type) for value_type in JSON_TYPES}
+
+
+def get_candidates(props, accepts_type, value_type):
+    return tuple(index for index, prop in enumerate(props) if accepts_type(prop, value_type))
+
+
+def has_default_checks(prop_class):
+    return (
+        prop_class.check is Prop.check and
+        prop_class.validate is Prop.validate and
+        prop_class.check_constraints is Prop.check_constraints and
+        hasattr(prop_class, "types")
+    )
+
+
+def accepts_input_type(prop, value_type):
+    """
+    Whether prop could accept an input value of value_type. Props that parse
+    their input (like Integer from "12") or customize validation may accept
+    anything.
+    """
+
+    prop_class = type(prop)
+
+    if value_type is NoneType or not has_default_checks(prop_class):
+        return True
+
+    if (
+        prop_class.parse_input is not Prop.parse_input or
+        prop_class.check_input is not Prop.check_input or
+        prop_class.parse_input_and_validate is not Prop.parse_input_and_validate or
+        prop_class.parse_and_check not in (Prop.parse_and_check, Object.parse_and_check, Array.parse_and_check)
+    ):
+        return True
+
+    return issubclass(value_type, prop.types)
+
+
+def accepts_output_type(prop, value_type):
+    """Whether prop could accept an output value of value_type. Types are checked before formatting."""
+
+    prop_class = type(prop)
+
+    if value_type is NoneType or not has_default_checks(prop_class):
+        return True
+
+    if (
+        prop_class.check_output is not Prop.check_output or
+        prop_class.format_output_and_validate is not Prop.format_output_and_validate or
+        prop_class.format_and_check not in (Prop.format_and_check, Object.format_and_check, Array.format_and_check)
+    ):
+        return True
+
+    return issubclass(value_type, prop.types)
+
+
+# Which props could accept a value of a given type, for each of the checks a OneOf dispatches.
+ACCEPTS_TYPE = {
+    "check_input": accepts_input_type,
+    "check_output": accepts_output_type,
+}
 
 
 def get_one_of_error_message(error_message_list, prop_value, field_name):
 
-    reasons = ", "
-    reasons = reasons.join(error_message_list)
+    reasons = ", ".join(["{}"] * len(error_message_list))
+
+    return ErrorMessage(
+        "The value {} from field '{}' is not valid for one of the defined props for the following reasons: " + reasons,
+        ValueRepr(prop_value),
+        field_name,
+        *error_message_list,
+    )
 
-    error_message = (f"The value {prop_value!r} from field '{field_name}' is not "
-                     f"valid for one of the defined props for the following reasons: {reasons}")
 
-    return error_message
+def get_unknown_tag_message(tag, discriminator, field_name, mapping):
+    return ErrorMessage(
+        "The value {} of '{}' from field '{}' is not one of the known values: {}",
+        ValueRepr(tag),
+        discriminator,
+        field_name,
+        ValueRepr(list(mapping)),
+    )
@@ -1,10 +1,39 @@
-import copy
+from collections.abc import Mapping
 
 from dos import prop
+from dos.cache import LRUCache
+
+
+def get_specialization_key(base_schema, overrides, only, exclude):
+    """
+    A hashable, canonical form of a specialize call. The base_schema items are
+    part of the key, so a base_schema that changes after being cached (like
+    ErrorFields') never returns a stale specialization.
+    """
+
+    canonical_overrides = None
+    if overrides:
+        canonical_overrides = tuple(sorted(
+            (override_name, tuple(sorted(override_values.items())))
+            for override_name, override_values in overrides.items()
+        ))
+
+    key = (
+        tuple(base_schema.items()),
+        canonical_overrides,
+        tuple(only) if only else None,
+        frozenset(exclude) if exclude else None,
+    )
+
+    hash(key)
+    return key
 
 
 class Fields:
 
+    # Shared by every Fields subclass, set to None to disable caching.
+    specialization_cache = LRUCache(maxsize=1024)
+
     def __init__(self, base_schema):
         self.base_schema = base_schema
 
@@ -13,31 +42,87 @@ class Fields:
 
     def specialize(self, overrides=None, only=None, exclude=None):
 
-        cloned = copy.deepcopy(self.base_schema)
+        # Read only and exclude once, so generators reach both the cache key
+        # and build_specialization intact.
+        only = tuple(only) if only is not None else None
+        exclude = tuple(exclude) if exclude is not None else None
 
-        if overrides:
-            for override_name, override_values in overrides.items():
+        cache = self.specialization_cache
 
-                overridden_prop = cloned[override_name]
+        if cache is None:
+            return self.build_specialization(overrides, only, exclude)
 
-                for override_attr, override_value in override_values.items():
-                    setattr(overridden_prop, override_attr, override_value)
+        try:
+            key = get_specialization_key(self.base_schema, overrides, only, exclude)
+        except TypeError:
+            # Unhashable override values (e.g. a list of validators) can't be cached.
+            return self.build_specialization(overrides, only, exclude)
 
-        if only:
+        specialized = cache.get_or_create(key, lambda: self.build_specialization(overrides, only, exclude))
+
+        # Callers are free to modify the dict they get back.
+        return dict(specialized)
 
-            trimmed = {}
+    def build_specialization(self, overrides=None, only=None, exclude=None):
+
+        # Props that aren't overridden are shared with base_schema rather than
+        # copied; the props named in overrides are evolved into new ones.
+        if only:
+            specialized = {}
 
             for field_name in only:
-                trimmed[field_name] = cloned[field_name]
+                specialized[field_name] = self.base_schema[field_name]
+        else:
+            specialized = dict(self.base_schema)
 
-            cloned = trimmed
+        if overrides:
+            for override_name, override_values in overrides.items():
+
+                base_prop = self.base_schema[override_name]
+
+                if override_name not in specialized:
+                    continue
+
+                specialized[override_name] = base_prop.evolve(**override_values)
 
         if exclude:
             for name in exclude:
-                if name in cloned:
-                    del cloned[name]
+                if name in specialized:
+                    del specialized[name]
+
+        return specialized
+
+
+class FrozenSchema(Mapping):
+    """
+    A read-only copy of a schema dict, with the sets of expected, required
+    and Array field names worked out once up front.
+    """
+
+    __slots__ = ("fields", "expected_fields", "required_fields", "required_field_set", "array_fields")
+
+    def __init__(self, schema):
+        self.fields = dict(schema)
+        self.expected_fields = frozenset(self.fields)
+        self.required_fields = tuple(
+            field_name for field_name, field_prop in self.fields.items() if field_prop.required
+        )
+        self.required_field_set = frozenset(self.required_fields)
+        self.array_fields = tuple(
+            field_name for field_name, field_prop in self.fields.items() if isinstance(field_prop, prop.Array)
+        )
+
+    def __getitem__(self, key):
+        return self.fields[key]
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
 
-        return cloned
+    def __repr__(self):
+        return f"FrozenSchema({self.fields!r})"
 
 
 class SuccessFields(Fields):
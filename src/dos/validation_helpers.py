@@ -1,12 +1,38 @@
-import re
+# Rules from http://rion.io/2013/09/10/validating-social-security-numbers-through-regular-expressions-2/
+BANNED_SOCIAL_SECURITY_NUMBERS = frozenset(("219099999", "078051120"))
+BANNED_AREAS = frozenset(["000", "666"] + [f"9{area:02d}" for area in range(100)])
+BANNED_GROUP = "00"
+BANNED_SERIAL = "0000"
 
 
-# source: http://rion.io/2013/09/10/validating-social-security-numbers-through-regular-expressions-2/
 def validate_social_security_number(potential_social_security_number):
     if not isinstance(potential_social_security_number, str):
         potential_social_security_number = str(potential_social_security_number)
 
-    if re.match(r'^(?!219099999|078051120)(?!666|000|9\d{2})\d{3}(?!00)\d{2}(?!0{4})\d{4}$', potential_social_security_number):
-        return True
+    return (
+        len(potential_social_security_number) == 9 and
+        potential_social_security_number.isascii() and
+        potential_social_security_number.isdigit() and
+        potential_social_security_number[:3] not in BANNED_AREAS and
+        potential_social_security_number[3:5] != BANNED_GROUP and
+        potential_social_security_number[5:] != BANNED_SERIAL and
+        potential_social_security_number not in BANNED_SOCIAL_SECURITY_NUMBERS
+    )
 
-    return False
+
+def validate_social_security_numbers(potential_social_security_numbers):
+    # The same checks as validate_social_security_number, inlined to avoid a call per value.
+    return [
+        len(value) == 9 and
+        value.isascii() and
+        value.isdigit() and
+        value[:3] not in BANNED_AREAS and
+        value[3:5] != BANNED_GROUP and
+        value[5:] != BANNED_SERIAL and
+        value not in BANNED_SOCIAL_SECURITY_NUMBERS
+        for value in (
+            potential_social_security_number if isinstance(potential_social_security_number, str)
+            else str(potential_social_security_number)
+            for potential_social_security_number in potential_social_security_numbers
+        )
+    ]
@@ -1,13 +1,46 @@
+import re
+from decimal import InvalidOperation
+
 from dos import prop, validation_helpers
+from dos.parsers import extract_number
 
 
 class Validator:
     supported_prop_classes = []
 
-    def validate_prop(self, prop_class, _):
+    def bind(self, prop_class):
+        """Called once when a prop is constructed with this validator."""
         if prop_class not in self.supported_prop_classes:
             raise prop.ValidationError(f"{self.__class__.__name__} is not supported for class {prop_class.__name__}!!")
 
+    def validate_prop(self, prop_class, prop_value):  # pylint: disable=unused-argument
+        return None
+
+    def validate_many(self, prop_class, prop_values):
+        """Validate every value of an array, returning an error message or None for each."""
+        return [self.validate_prop(prop_class, prop_value) for prop_value in prop_values]
+
+    def open_api_constraints(self):
+        return {}
+
+
+def numeric_string_value(prop_value):
+    """
+    The number a Numeric prop's string value holds, like Decimal("5") for
+    "5", or None when it doesn't hold a finite number.
+    """
+
+    try:
+        number = extract_number(prop_value)
+    except InvalidOperation:
+        return None
+
+    return number if number.is_finite() else None
+
+
+def not_a_number_message(prop_value):
+    return prop.ErrorMessage("The string '{}' is not a valid number!", prop.ValueStr(prop_value))
+
 
 class ExactLength(Validator):
     supported_prop_classes = [prop.String, prop.Number, prop.Numeric, prop.Integer]
@@ -16,11 +49,14 @@ class ExactLength(Validator):
         self.exact_length = exact_length
 
     def validate_prop(self, prop_class, prop_value):
-        super().validate_prop(prop_class, prop_value)
-
         if len(prop_value) != self.exact_length:
-            return (f"{prop_class.__name__} is not the correct length! The string \'{prop_value}\' is "
-                    f"{len(prop_value)} characters long, not {self.exact_length}!")
+            return prop.ErrorMessage(
+                "{} is not the correct length! The string '{}' is {} characters long, not {}!",
+                prop_class.__name__,
+                prop.ValueStr(prop_value),
+                len(prop_value),
+                self.exact_length,
+            )
 
         return None
 
@@ -29,9 +65,255 @@ class SocialSecurityNumber(Validator):
     supported_prop_classes = [prop.String]
 
     def validate_prop(self, prop_class, prop_value):
-        super().validate_prop(prop_class, prop_value)
-
         if validation_helpers.validate_social_security_number(prop_value) is False:
-            return f"{str(prop_value)} is not a valid social security number!"
+            return self.error_message(prop_value)
+
+        return None
+
+    def validate_many(self, prop_class, prop_values):
+        return [
+            None if is_valid else self.error_message(prop_value)
+            for prop_value, is_valid in zip(
+                prop_values, validation_helpers.validate_social_security_numbers(prop_values)
+            )
+        ]
+
+    def error_message(self, prop_value):
+        return prop.ErrorMessage("{} is not a valid social security number!", prop.ValueStr(prop_value))
+
+
+class MinLength(Validator):
+    supported_prop_classes = [prop.String]
+
+    def __init__(self, min_length):
+        self.min_length = min_length
+
+    def validate_prop(self, prop_class, prop_value):
+        if prop_value is not None and len(prop_value) < self.min_length:
+            return self.error_message(prop_class, prop_value)
+
+        return None
+
+    def validate_many(self, prop_class, prop_values):
+        min_length = self.min_length
+
+        return [
+            self.error_message(prop_class, prop_value)
+            if prop_value is not None and len(prop_value) < min_length else None
+            for prop_value in prop_values
+        ]
+
+    def error_message(self, prop_class, prop_value):
+        return prop.ErrorMessage(
+            "{} is too short! The string '{}' is {} characters long, less than {}!",
+            prop_class.__name__,
+            prop.ValueStr(prop_value),
+            len(prop_value),
+            self.min_length,
+        )
+
+    def open_api_constraints(self):
+        return {"minLength": self.min_length}
+
+
+class MaxLength(Validator):
+    supported_prop_classes = [prop.String]
+
+    def __init__(self, max_length):
+        self.max_length = max_length
+
+    def validate_prop(self, prop_class, prop_value):
+        if prop_value is not None and len(prop_value) > self.max_length:
+            return self.error_message(prop_class, prop_value)
 
         return None
+
+    def validate_many(self, prop_class, prop_values):
+        max_length = self.max_length
+
+        return [
+            self.error_message(prop_class, prop_value)
+            if prop_value is not None and len(prop_value) > max_length else None
+            for prop_value in prop_values
+        ]
+
+    def error_message(self, prop_class, prop_value):
+        return prop.ErrorMessage(
+            "{} is too long! The string '{}' is {} characters long, more than {}!",
+            prop_class.__name__,
+            prop.ValueStr(prop_value),
+            len(prop_value),
+            self.max_length,
+        )
+
+    def open_api_constraints(self):
+        return {"maxLength": self.max_length}
+
+
+class Range(Validator):
+    supported_prop_classes = [prop.Integer, prop.Number, prop.Numeric]
+
+    def __init__(self, minimum=None, maximum=None):
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def validate_prop(self, prop_class, prop_value):
+        if prop_value is None:
+            return None
+
+        number = prop_value
+
+        # Numeric props can hold numbers as strings, which are compared by the number they hold.
+        if isinstance(prop_value, str):
+            number = numeric_string_value(prop_value)
+
+            if number is None:
+                return not_a_number_message(prop_value)
+
+        if self.minimum is not None and number < self.minimum:
+            return prop.ErrorMessage(
+                "The value {} is less than the minimum of {}!", prop.ValueStr(prop_value), self.minimum
+            )
+
+        if self.maximum is not None and number > self.maximum:
+            return prop.ErrorMessage(
+                "The value {} is more than the maximum of {}!", prop.ValueStr(prop_value), self.maximum
+            )
+
+        return None
+
+    def validate_many(self, prop_class, prop_values):
+        # Bounds that aren't set are widened to infinity, so each value is checked with one chained comparison.
+        minimum = float("-inf") if self.minimum is None else self.minimum
+        maximum = float("inf") if self.maximum is None else self.maximum
+
+        try:
+            return [
+                None if prop_value is None or minimum <= prop_value <= maximum
+                else self.validate_prop(prop_class, prop_value)
+                for prop_value in prop_values
+            ]
+        except TypeError:
+            # Strings from a Numeric prop can't be compared directly, so each value is checked on its own.
+            return super().validate_many(prop_class, prop_values)
+
+    def open_api_constraints(self):
+        constraints = {}
+
+        if self.minimum is not None:
+            constraints["minimum"] = self.minimum
+
+        if self.maximum is not None:
+            constraints["maximum"] = self.maximum
+
+        return constraints
+
+
+class Pattern(Validator):
+    supported_prop_classes = [prop.String]
+
+    def __init__(self, pattern):
+        self.pattern = re.compile(pattern)
+
+    def validate_prop(self, prop_class, prop_value):
+        if prop_value is not None and self.pattern.search(prop_value) is None:
+            return self.error_message(prop_value)
+
+        return None
+
+    def validate_many(self, prop_class, prop_values):
+        search = self.pattern.search
+
+        return [
+            self.error_message(prop_value) if prop_value is not None and search(prop_value) is None else None
+            for prop_value in prop_values
+        ]
+
+    def error_message(self, prop_value):
+        return prop.ErrorMessage(
+            "The string '{}' does not match the pattern {}!", prop.ValueStr(prop_value), self.pattern.pattern
+        )
+
+    def open_api_constraints(self):
+        return {"pattern": self.pattern.pattern}
+
+
+class OneOfValues(Validator):
+    supported_prop_classes = [prop.String, prop.Integer, prop.Number, prop.Numeric]
+
+    def __init__(self, values):
+        self.values = tuple(values)
+        self.value_set = frozenset(self.values)
+
+    def validate_prop(self, prop_class, prop_value):
+        if prop_value is not None and prop_value not in self.value_set:
+            return self.numeric_string_error(prop_class, prop_value)
+
+        return None
+
+    def validate_many(self, prop_class, prop_values):
+        value_set = self.value_set
+
+        return [
+            self.numeric_string_error(prop_class, prop_value)
+            if prop_value is not None and prop_value not in value_set else None
+            for prop_value in prop_values
+        ]
+
+    def numeric_string_error(self, prop_class, prop_value):
+        """
+        The error for a value that isn't one of the allowed values, unless it's
+        a Numeric prop's string holding one of them, like "1" for 1.
+        """
+
+        if not (isinstance(prop_value, str) and issubclass(prop_class, prop.Numeric)):
+            return self.error_message(prop_value)
+
+        number = numeric_string_value(prop_value)
+
+        if number is None:
+            return not_a_number_message(prop_value)
+
+        if number not in self.value_set:
+            return self.error_message(prop_value)
+
+        return None
+
+    def error_message(self, prop_value):
+        return prop.ErrorMessage(
+            "The value {} is not one of the allowed values: {}!",
+            prop.ValueRepr(prop_value),
+            prop.ValueRepr(list(self.values)),
+        )
+
+    def open_api_constraints(self):
+        return {"enum": list(self.values)}
+
+
+class MaxItems(Validator):
+    supported_prop_classes = [prop.Array]
+
+    def __init__(self, max_items):
+        self.max_items = max_items
+
+    def validate_prop(self, prop_class, prop_value):
+        if prop_value is not None and len(prop_value) > self.max_items:
+            return self.error_message(prop_value)
+
+        return None
+
+    def validate_many(self, prop_class, prop_values):
+        max_items = self.max_items
+
+        return [
+            self.error_message(prop_value) if prop_value is not None and len(prop_value) > max_items else None
+            for prop_value in prop_values
+        ]
+
+    def error_message(self, prop_value):
+        return prop.ErrorMessage(
+            "The array has {} items, more than the maximum of {}!", len(prop_value), self.max_items
+        )
+
+    def open_api_constraints(self):
+        return {"maxItems": self.max_items}
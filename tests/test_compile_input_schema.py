@@ -0,0 +1,175 @@
+from http import HTTPStatus
+
+import pytest
+
+from dos import prop, prop_wrapper, validators
+from dos.compiler import compile_input_schema
+from dos.flask_wrappers import validate_and_parse_input, validate_input
+
+
+class UpperCaseString(prop.String):
+
+    def parse_input_and_validate(self, input_structure_field_name, body, prop_value=prop.NO_VALUE):
+        value = super().parse_input_and_validate(input_structure_field_name, body, prop_value)
+        if value is not None and value != value.upper():
+            raise prop.ValidationError(f"'{input_structure_field_name}' must be upper case!")
+        return value
+
+
+INPUT_SCHEMA = {
+    "basic_string": prop.String(),
+    "basic_boolean": prop.Boolean(required=False),
+    "nullable_integer": prop.Integer(required=False, nullable=True),
+    "number": prop.Number(required=False),
+    "date": prop.DateTime(required=False),
+    "one_of": prop_wrapper.OneOf([
+        prop.String(required=False),
+        prop.Number(required=False),
+    ]),
+    "custom": UpperCaseString(required=False),
+    "object": prop.Object(structure={"a": prop.String()}, required=False),
+}
+
+
+@pytest.mark.parametrize("given_request", [
+    {"basic_string": "hello"},
+    {"basic_string": "hello", "what_the_heck": 1},
+    {"basic_string": "hello", "what_the_heck": 1, "more_BS": 2},
+    {},
+    {"what_the_heck": 1},
+    {"basic_string": None},
+    {"basic_string": ["what", "the", "heck"]},
+    {"basic_string": "hello", "basic_boolean": "true"},
+    {"basic_string": "hello", "nullable_integer": None},
+    {"basic_string": "hello", "nullable_integer": "12"},
+    {"basic_string": "hello", "nullable_integer": "twelve"},
+    {"basic_string": "hello", "number": "1,000"},
+    {"basic_string": "hello", "number": "banana_phone"},
+    {"basic_string": "hello", "date": "2020-07-01"},
+    {"basic_string": "hello", "date": "not a date"},
+    {"basic_string": "hello", "one_of": "abc"},
+    {"basic_string": "hello", "one_of": "12"},
+    {"basic_string": "hello", "one_of": ["banana_phone"]},
+    {"basic_string": "hello", "custom": "UPPER"},
+    {"basic_string": "hello", "custom": "lower"},
+    {"basic_string": "hello", "object": {"a": "b"}},
+    {"basic_string": "hello", "object": "not an object"},
+    {"basic_string": 12, "nullable_integer": "twelve", "one_of": True},
+])
+def test_compiled_matches_interpreted(given_request):
+
+    compiled_validator = compile_input_schema(INPUT_SCHEMA)
+
+    assert validate_and_parse_input(given_request, INPUT_SCHEMA, compiled_validator) == \
+        validate_and_parse_input(given_request, INPUT_SCHEMA)
+
+
+VALIDATED_INPUT_SCHEMA = {
+    "exact_length": prop.String(validators=[validators.ExactLength(3)]),
+    "social_security_number": prop.String(validators=[validators.SocialSecurityNumber()]),
+    "one_of": prop_wrapper.OneOf([
+        prop.String(validators=[validators.ExactLength(3)]),
+        prop.Number(),
+    ]),
+}
+
+
+@pytest.mark.parametrize("exact_length, social_security_number, one_of", [
+    ("abc", "578271234", "abc"),
+    ("abcd", "578271234", "12"),
+    ("abc", "219099999", "banana_phone"),
+    ("abcd", "219099999", None),
+])
+def test_compiled_validators_match_interpreted(exact_length, social_security_number, one_of):
+
+    given_request = {
+        "exact_length": exact_length,
+        "social_security_number": social_security_number,
+        "one_of": one_of,
+    }
+
+    compiled_validator = compile_input_schema(VALIDATED_INPUT_SCHEMA)
+
+    assert validate_and_parse_input(given_request, VALIDATED_INPUT_SCHEMA, compiled_validator) == \
+        validate_and_parse_input(given_request, VALIDATED_INPUT_SCHEMA)
+
+
+def test_compiled_one_of_invalid():
+
+    input_schema = {
+        "id": prop_wrapper.OneOf([
+            prop.String(validators=[validators.ExactLength(3)]),
+            prop.String(validators=[validators.ExactLength(8)]),
+            prop.Number()
+        ])
+    }
+
+    compiled_validator = compile_input_schema(input_schema)
+
+    http_status, reject_dict, validated_input = compiled_validator({"id": "banana_phone"})
+    assert validated_input is None
+    assert reject_dict == {
+        'message': 'A field has an error.',
+        'field_error_messages': {
+            'id': ("The value 'banana_phone' from field 'id' is not valid for one of the defined props for "
+                   "the following reasons: String is not the correct length! The string 'banana_phone' is "
+                   "12 characters long, not 3!, String is not the correct length! The string 'banana_phone' is "
+                   "12 characters long, not 8!, The value 'banana_phone' from field 'id' is the wrong "
+                   'type, expected: Number')
+        }
+    }
+    assert http_status == HTTPStatus.BAD_REQUEST
+
+
+DOG = prop.Object(structure={"type": prop.String(), "barks": prop.Boolean()})
+CAT = prop.Object(structure={"type": prop.String(), "lives": prop.Integer()})
+
+NESTED_ONE_OF_INPUT_SCHEMA = {
+    "object": prop.Object(
+        structure={"id": prop_wrapper.OneOf([prop.Integer(), prop.String()])},
+        required=False,
+    ),
+    "ids": prop.Array(repeated_structure=prop_wrapper.OneOf([prop.Integer(), prop.String()]), required=False),
+    "pets": prop.Array(
+        repeated_structure=prop_wrapper.OneOf(discriminator="type", mapping={"dog": DOG, "cat": CAT}),
+        required=False,
+    ),
+}
+
+
+@pytest.mark.parametrize("given_request, expected_input", [
+    ({"object": {"id": "3"}}, {"object": {"id": 3}}),
+    ({"object": {"id": "three"}}, {"object": {"id": "three"}}),
+    ({"ids": ["3", "three", 4]}, {"ids": [3, "three", 4]}),
+    (
+        {"pets": [{"type": "dog", "barks": True}, {"type": "cat", "lives": "9"}]},
+        {"pets": [{"type": "dog", "barks": True}, {"type": "cat", "lives": 9}]},
+    ),
+    ({"object": {"id": ["three"]}}, None),
+    ({"ids": ["3", ["three"]]}, None),
+    ({"pets": [{"type": "dog", "barks": True}, {"type": "fish"}]}, None),
+])
+def test_nested_one_of(given_request, expected_input):
+
+    compiled_validator = compile_input_schema(NESTED_ONE_OF_INPUT_SCHEMA)
+
+    interpreted = validate_and_parse_input(given_request, NESTED_ONE_OF_INPUT_SCHEMA)
+    http_status, _, validated_input = interpreted
+
+    assert validated_input == expected_input
+    assert http_status == (HTTPStatus.OK if expected_input is not None else HTTPStatus.BAD_REQUEST)
+    assert validate_and_parse_input(given_request, NESTED_ONE_OF_INPUT_SCHEMA, compiled_validator) == interpreted
+
+
+def test_uncompilable_schema_falls_back():
+
+    assert compile_input_schema({"basic_string": "not a prop"}) is None
+    assert compile_input_schema(["not", "a", "dict"]) is None
+
+
+def test_compiled_validator_ignores_non_dict_body():
+
+    input_schema = {"basic_string": prop.String()}
+    compiled_validator = compile_input_schema(input_schema)
+
+    assert validate_input([], input_schema, compiled_validator) == validate_input([], input_schema)
@@ -0,0 +1,134 @@
+import datetime
+import enum
+from http import HTTPStatus
+
+import arrow
+import pytest
+
+from dos import prop, prop_wrapper, validators
+from dos.compiler import compile_output_schema
+from dos.flask_wrappers import create_output
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class LoudString(prop.String):
+
+    def format_output(self, prop_value):
+        return prop_value.upper() if prop_value is not None else None
+
+
+OUTPUT_SCHEMA = {
+    HTTPStatus.OK: {
+        "basic_string": prop.String(),
+        "optional_string": prop.String(required=False),
+        "nullable_string": prop.String(required=False, nullable=True),
+        "date": prop.DateTime(required=False),
+        "native_date": prop.DateTime(required=False, native=True),
+        "color": prop.Enum(required=False, nullable=True),
+        "number": prop.Number(required=False),
+        "loud": LoudString(required=False),
+        "one_of": prop_wrapper.OneOf([prop.String(required=False), prop.Boolean(required=False)]),
+        "object": prop.Object(
+            structure={
+                "sub_string": prop.String(),
+                "optional": prop.String(required=False, nullable=True),
+                "sub_object": prop.Object(structure={"boo": prop.Boolean()}, required=False, nullable=True),
+            },
+            required=False,
+            nullable=True,
+        ),
+        "array_of_objects": prop.Array(
+            repeated_structure=prop.Object(structure={"id": prop.Integer(), "when": prop.DateTime()}),
+            required=False,
+            nullable=True,
+        ),
+        "array_of_strings": prop.Array(repeated_structure=prop.String(), required=False),
+        "array_of_one_of": prop.Array(
+            repeated_structure=prop_wrapper.OneOf([prop.String(), prop.Integer()]),
+            required=False,
+        ),
+    },
+    HTTPStatus.NOT_FOUND: {
+        "message": prop.String(),
+    },
+    HTTPStatus.CONFLICT: {
+        "exact_length": prop.String(validators=[validators.ExactLength(3)]),
+    },
+}
+
+
+def outcome(endpoint_result, compiled_formatters=None):
+    try:
+        return create_output(endpoint_result, OUTPUT_SCHEMA, compiled_formatters)
+    except prop.ValidationError as validation_error:
+        return "error", validation_error.message
+
+
+@pytest.mark.parametrize("endpoint_result", [
+    (HTTPStatus.OK, {"basic_string": "hello", "secret": "not this"}),
+    (HTTPStatus.OK, {}),
+    (HTTPStatus.OK, {"basic_string": None}),
+    (HTTPStatus.OK, {"basic_string": 80.99}),
+    (HTTPStatus.OK, {"basic_string": "hello", "optional_string": None}),
+    (HTTPStatus.OK, {"basic_string": "hello", "nullable_string": None}),
+    (HTTPStatus.OK, {"basic_string": "hello", "date": arrow.get(2020, 7, 1)}),
+    (HTTPStatus.OK, {"basic_string": "hello", "date": "2020-07-01"}),
+    (HTTPStatus.OK, {"basic_string": "hello", "native_date": datetime.date(2020, 7, 1)}),
+    (HTTPStatus.OK, {"basic_string": "hello", "native_date": datetime.datetime(2020, 7, 1, 10, 30)}),
+    (HTTPStatus.OK, {"basic_string": "hello", "native_date": arrow.get(2020, 7, 1)}),
+    (HTTPStatus.OK, {"basic_string": "hello", "color": Color.RED}),
+    (HTTPStatus.OK, {"basic_string": "hello", "color": "red"}),
+    (HTTPStatus.OK, {"basic_string": "hello", "number": "80.99"}),
+    (HTTPStatus.OK, {"basic_string": "hello", "loud": "quiet"}),
+    (HTTPStatus.CONFLICT, {"exact_length": "abc"}),
+    (HTTPStatus.CONFLICT, {"exact_length": "abcd"}),
+    (HTTPStatus.OK, {"basic_string": "hello", "one_of": True}),
+    (HTTPStatus.OK, {"basic_string": "hello", "one_of": 12}),
+    (HTTPStatus.OK, {"basic_string": "hello", "object": None}),
+    (HTTPStatus.OK, {"basic_string": "hello", "object": {"sub_string": "a", "extra": 1}}),
+    (HTTPStatus.OK, {"basic_string": "hello", "object": {"sub_string": "a", "sub_object": {"boo": False}}}),
+    (HTTPStatus.OK, {"basic_string": "hello", "object": {"sub_string": "a", "sub_object": {"boo": "no"}}}),
+    (HTTPStatus.OK, {"basic_string": "hello", "object": {"optional": "a"}}),
+    (HTTPStatus.OK, {"basic_string": "hello", "object": ["not", "a", "dict"]}),
+    (HTTPStatus.OK, {"basic_string": "hello", "array_of_objects": None}),
+    (HTTPStatus.OK, {"basic_string": "hello", "array_of_objects": []}),
+    (HTTPStatus.OK, {"basic_string": "hello", "array_of_objects": [
+        {"id": 1, "when": arrow.get(2020, 7, 1), "secret": "no"},
+        {"id": 2, "when": "2020-07-02"},
+    ]}),
+    (HTTPStatus.OK, {"basic_string": "hello", "array_of_objects": [{"id": 1}]}),
+    (HTTPStatus.OK, {"basic_string": "hello", "array_of_objects": [None]}),
+    (HTTPStatus.OK, {"basic_string": "hello", "array_of_strings": ["a", "b"]}),
+    (HTTPStatus.OK, {"basic_string": "hello", "array_of_strings": ["a", 2]}),
+    (HTTPStatus.OK, {"basic_string": "hello", "array_of_one_of": ["a", 2]}),
+    (HTTPStatus.OK, {"basic_string": "hello", "array_of_one_of": ["a", 2.5]}),
+    (HTTPStatus.NOT_FOUND, {"message": "No dog by that name found!"}),
+    (HTTPStatus.BAD_REQUEST, {"message": "Not in the schema"}),
+    (HTTPStatus.NOT_FOUND, None),
+])
+def test_compiled_matches_interpreted(endpoint_result):
+
+    compiled_formatters = compile_output_schema(OUTPUT_SCHEMA)
+
+    assert outcome(endpoint_result, compiled_formatters) == outcome(endpoint_result)
+
+
+def test_compiled_formatter_per_status():
+
+    compiled_formatters = compile_output_schema(OUTPUT_SCHEMA)
+
+    assert set(compiled_formatters) == {HTTPStatus.OK, HTTPStatus.NOT_FOUND, HTTPStatus.CONFLICT}
+    assert compiled_formatters[HTTPStatus.NOT_FOUND]({"message": "Oh man", "secret": 1}) == {"message": "Oh man"}
+
+
+def test_uncompilable_status_falls_back():
+
+    output_schema = {
+        HTTPStatus.OK: {"message": prop.String()},
+        HTTPStatus.NOT_FOUND: {"message": "not a prop"},
+    }
+
+    assert set(compile_output_schema(output_schema)) == {HTTPStatus.OK}
@@ -3,8 +3,9 @@ from http import HTTPStatus
 import pytest
 
 from dos import prop, prop_wrapper, validators
-from dos.schema import Fields
-from dos.flask_wrappers import create_output
+from dos.schema import Fields, FrozenSchema
+from dos.compiler import compile_output_schema
+from dos.flask_wrappers import ArrayStream, create_output
 
 
 class SimpleFields(Fields):
@@ -912,6 +913,61 @@ def test_one_of_invalid():
                                "from field 'basic_string' is the wrong type, expected: Boolean")
 
 
+def test_one_of_dispatches_on_type():
+
+    class CountingObject(prop.Object):
+        __slots__ = ()
+        calls = 0
+
+        def format_output(self, prop_value):
+            CountingObject.calls += 1
+            return super().format_output(prop_value)
+
+    output_schema = {
+        HTTPStatus.OK: {
+            "result": prop_wrapper.OneOf([
+                CountingObject(structure={"name": prop.String()}),
+                prop.Integer(),
+                prop.Boolean(),
+            ])
+        }
+    }
+
+    assert create_output((HTTPStatus.OK, {"result": False}), output_schema) == (HTTPStatus.OK, {"result": False})
+    assert create_output((HTTPStatus.OK, {"result": 3}), output_schema) == (HTTPStatus.OK, {"result": 3})
+    assert CountingObject.calls == 0
+
+    with pytest.raises(prop.ValidationError) as e:
+        create_output((HTTPStatus.OK, {"result": "no"}), output_schema)
+
+    assert e.value.message == ("The value 'no' from field 'result' is not valid for one of the defined props "
+                               "for the following reasons: The value 'no' from field 'result' is the wrong type, "
+                               "expected: CountingObject, The value 'no' from field 'result' is the wrong type, "
+                               "expected: Integer, The value 'no' from field 'result' is the wrong type, "
+                               "expected: Boolean")
+
+
+def test_one_of_discriminator():
+
+    dog = prop.Object(structure={"type": prop.String(), "barks": prop.Boolean()})
+    cat = prop.Object(structure={"type": prop.String(), "lives": prop.Integer()})
+
+    output_schema = {
+        HTTPStatus.OK: {
+            "pet": prop_wrapper.OneOf(discriminator="type", mapping={"dog": dog, "cat": cat}),
+        }
+    }
+
+    result = HTTPStatus.OK, {"pet": {"type": "dog", "barks": True, "lives": 9}}
+
+    assert create_output(result, output_schema) == (HTTPStatus.OK, {"pet": {"type": "dog", "barks": True}})
+
+    with pytest.raises(prop.ValidationError) as e:
+        create_output((HTTPStatus.OK, {"pet": {"type": None}}), output_schema)
+
+    assert e.value.message == "The value None of 'type' from field 'pet' is not one of the known values: ['dog', 'cat']"
+
+
 def test_output_of_wrong_type():
 
     output_schema = {
@@ -1004,6 +1060,40 @@ def test_output_numeric_string():
     }
 
 
+NUMERIC_OUTPUT_SCHEMA = {
+    HTTPStatus.OK: {
+        "ranged": prop.Numeric(required=False, validators=[validators.Range(0, 10)]),
+        "choice": prop.Numeric(required=False, validators=[validators.OneOfValues([1, 2])]),
+        "ranged_array": prop.Array(
+            repeated_structure=prop.Numeric(validators=[validators.Range(0, 10)]), required=False
+        ),
+    }
+}
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+@pytest.mark.parametrize("body,message", [
+    ({"ranged": "5", "choice": "1", "ranged_array": [3, "4.5"]}, None),
+    ({"ranged": "11"}, "The value 11 is more than the maximum of 10!"),
+    ({"ranged": "five"}, "The string 'five' is not a valid number!"),
+    ({"choice": "3"}, "The value '3' is not one of the allowed values: [1, 2]!"),
+    ({"choice": "one"}, "The string 'one' is not a valid number!"),
+    ({"ranged_array": [3, "-1"]}, "The value -1 is less than the minimum of 0!"),
+])
+def test_output_numeric_string_validators(compiled, body, message):
+
+    compiled_formatters = compile_output_schema(NUMERIC_OUTPUT_SCHEMA) if compiled else None
+
+    if message is None:
+        assert create_output((HTTPStatus.OK, body), NUMERIC_OUTPUT_SCHEMA, compiled_formatters) == (HTTPStatus.OK, body)
+        return
+
+    with pytest.raises(prop.ValidationError) as e:
+        create_output((HTTPStatus.OK, body), NUMERIC_OUTPUT_SCHEMA, compiled_formatters)
+
+    assert message in e.value.message
+
+
 def test_arrow_date():
     output_schema = {
         HTTPStatus.OK: {
@@ -1070,3 +1160,48 @@ def test_none_enum():
     http_status_code, returned_dict = create_output(result, output_schema)
     assert http_status_code == 200
     assert returned_dict == {}
+
+
+def test_create_output_streams_iterators():
+
+    output_schema = {
+        HTTPStatus.OK: {
+            "results": prop.Array(repeated_structure=prop.Object(structure={"id": prop.Integer()})),
+            "total": prop.Integer(),
+        }
+    }
+
+    rows = ({"id": row, "secret": "not this"} for row in range(3))
+    http_status, output = create_output((HTTPStatus.OK, {"results": rows, "total": 3}), output_schema)
+
+    assert http_status is HTTPStatus.OK
+    assert isinstance(output["results"], ArrayStream)
+    assert output["total"] == 3
+    assert list(output["results"]) == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+    frozen_output_schema = {HTTPStatus.OK: FrozenSchema(output_schema[HTTPStatus.OK])}
+    assert frozen_output_schema[HTTPStatus.OK].array_fields == ("results",)
+
+    rows = ({"id": row} for row in range(2))
+    _, output = create_output((HTTPStatus.OK, {"results": rows, "total": 2}), frozen_output_schema)
+    assert list(output["results"]) == [{"id": 0}, {"id": 1}]
+
+    rows = iter([{"id": 0}, {"id": "one"}])
+    _, output = create_output((HTTPStatus.OK, {"results": rows, "total": 2}), output_schema)
+
+    with pytest.raises(prop.ValidationError):
+        list(output["results"])
+
+
+def test_create_output_streaming_needs_every_element_for_array_validators():
+
+    output_schema = {
+        HTTPStatus.OK: {
+            "ids": prop.Array(repeated_structure=prop.Integer(), validators=validators.MaxItems(2)),
+        }
+    }
+
+    assert create_output((HTTPStatus.OK, {"ids": iter([1, 2])}), output_schema) == (HTTPStatus.OK, {"ids": [1, 2]})
+
+    with pytest.raises(prop.ValidationError):
+        create_output((HTTPStatus.OK, {"ids": iter([1, 2, 3])}), output_schema)
@@ -2,7 +2,7 @@ from http import HTTPStatus
 import json
 
 from dos.open_api import OpenAPI
-from dos import prop, prop_wrapper
+from dos import prop, prop_wrapper, validators
 from dos.schema import Fields
 
 
@@ -538,7 +538,7 @@ def test_document_array_of_strings():
                         "required": ["results", "blah"], "properties": {
                             "results": {
                                 "type": "array", "nullable": False, "description": "An array of a bunch of strings.",
-                                "items": {"type": "strings"}
+                                "items": {"type": "string", "nullable": False}
                             }, "blah": {
                                 "type": "object", "nullable": False, "description": "another cool object",
                                 "allOf": [{"$ref": "#/components/schemas/fake_plan_get_200_output_blah"}]
@@ -1130,7 +1130,9 @@ def test_document_one_of():
                                         }
                                           }]
                             }, "whoa": {"type": "string", "nullable": False, "description": "hello"},
-                            "array_str": {"type": "array", "nullable": False, "items": {"type": "booleans"}},
+                            "array_str": {
+                                "type": "array", "nullable": False, "items": {"type": "boolean", "nullable": False}
+                            },
                             "array of objects": {
                                 "type": "array", "nullable": False, "description": "WHat!!!",
                                 "items": {"$ref": "#/components/schemas/fake_plan_get_200_output_array of objects"}
@@ -1159,3 +1161,60 @@ def test_document_one_of():
     )
 
     assert documentation_json == expected_json
+
+
+def test_document_one_of_discriminator():
+
+    open_api = OpenAPI("Capital Rx Fake API", "1.0")
+
+    dog = prop.Object(structure={"type": prop.String(), "barks": prop.Boolean()})
+    cat = prop.Object(structure={"type": prop.String(), "lives": prop.Integer()})
+
+    schema_name = open_api.add_schema("/pet/get", "input", {
+        "pet": prop_wrapper.OneOf(discriminator="type", mapping={"dog": dog, "cat": cat}),
+    })
+
+    assert open_api["components"]["schemas"][schema_name]["properties"]["pet"] == {
+        "oneOf": [
+            {"$ref": "#/components/schemas/pet_get_input_pet_object_0"},
+            {"$ref": "#/components/schemas/pet_get_input_pet_object_1"},
+        ],
+        "discriminator": {
+            "propertyName": "type",
+            "mapping": {
+                "dog": "#/components/schemas/pet_get_input_pet_object_0",
+                "cat": "#/components/schemas/pet_get_input_pet_object_1",
+            },
+        },
+    }
+
+
+def test_document_validator_constraints():
+
+    open_api = OpenAPI("Capital Rx Fake API", "1.0")
+
+    schema_name = open_api.add_schema("/dog/get", "input", {
+        "name": prop.String(validators=[validators.MinLength(1), validators.MaxLength(20)]),
+        "code": prop.String(validators=validators.Pattern("^[A-Z]{3}$")),
+        "size": prop.String(validators=validators.OneOfValues(["small", "large"])),
+        "age": prop.Integer(validators=validators.Range(minimum=0, maximum=30)),
+        "tags": prop.Array(repeated_structure=prop.String(), validators=validators.MaxItems(5)),
+        "codes": prop.Array(
+            repeated_structure=prop.String("A code.", validators=[validators.Pattern("^[A-Z]+$"), validators.MaxLength(3)])
+        ),
+    })
+
+    properties = open_api["components"]["schemas"][schema_name]["properties"]
+
+    assert properties["name"] == {"type": "string", "nullable": False, "minLength": 1, "maxLength": 20}
+    assert properties["code"] == {"type": "string", "nullable": False, "pattern": "^[A-Z]{3}$"}
+    assert properties["size"] == {"type": "string", "nullable": False, "enum": ["small", "large"]}
+    assert properties["age"] == {"type": "integer", "nullable": False, "minimum": 0, "maximum": 30}
+    assert properties["tags"] == {
+        "type": "array", "nullable": False, "maxItems": 5, "items": {"type": "string", "nullable": False}
+    }
+    assert properties["codes"] == {
+        "type": "array", "nullable": False, "items": {
+            "type": "string", "nullable": False, "description": "A code.", "pattern": "^[A-Z]+$", "maxLength": 3,
+        }
+    }
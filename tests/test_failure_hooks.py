@@ -0,0 +1,69 @@
+import logging
+
+from dos import prop
+from dos.failure_hooks import RateLimitedFailureHook
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_root_logger_untouched():
+
+    assert logging.getLogger().level == logging.WARNING
+
+
+def test_failures_counted_and_sampled(caplog):
+
+    clock = FakeClock()
+    hook = RateLimitedFailureHook(sample_size=2, interval=10.0, clock=clock)
+
+    with caplog.at_level(logging.WARNING, logger="dos"):
+        for _ in range(5):
+            hook(prop.Integer(), "count", "Bad count", "invalid literal")
+
+        clock.now = 10.0
+        hook(prop.Number(), "price", "Bad price", "invalid number")
+
+    assert hook.get_counts() == {"Integer": 5, "Number": 1}
+    assert [record.getMessage() for record in caplog.records] == [
+        "Bad count /// Error: invalid literal",
+        "Bad count /// Error: invalid literal",
+        "3 more parse failures were not logged",
+        "Bad price /// Error: invalid number",
+    ]
+
+
+def test_custom_parse_failure_hook():
+
+    failures = []
+
+    prop.set_parse_failure_hook(lambda *failure: failures.append(failure))
+
+    try:
+        _, failure = prop.Integer().check_input("count", {"count": "twelve"})
+    finally:
+        prop.set_parse_failure_hook(RateLimitedFailureHook())
+
+    assert len(failures) == 1
+
+    failed_prop, field_name, message, parse_error = failures[0]
+
+    assert (type(failed_prop), field_name) == (prop.Integer, "count")
+    assert str(message) == str(failure.message)
+    assert str(parse_error) == "invalid literal for int() with base 10: 'twelve'"
+
+
+def test_parse_failure_hook_disabled():
+
+    prop.set_parse_failure_hook(None)
+
+    try:
+        assert prop.Integer().check_input("count", {"count": "twelve"})[0] is None
+    finally:
+        prop.set_parse_failure_hook(RateLimitedFailureHook())
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+
+def imported_after(statement):
+    completed = subprocess.run(
+        [sys.executable, "-c", f"import sys; {statement}; print(' '.join(sorted(sys.modules)))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return set(completed.stdout.split())
+
+
+def test_heavy_dependencies_imported_lazily():
+
+    modules = imported_after(
+        "import dos.prop, dos.prop_wrapper, dos.validators, dos.schema, dos.open_api, dos.flask_wrappers"
+    )
+
+    assert {"arrow", "flask", "http.client"}.isdisjoint(modules)
+
+
+def test_arrow_imported_on_first_date_time_parse():
+
+    native = imported_after("from dos import prop; prop.DateTime(native=True).parse_input('2020-07-01')")
+    arrow = imported_after("from dos import prop; prop.DateTime().parse_input('2020-07-01')")
+
+    assert "arrow" not in native
+    assert "arrow" in arrow
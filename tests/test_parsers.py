@@ -0,0 +1,182 @@
+import datetime
+from decimal import Decimal, InvalidOperation
+
+import arrow
+import pytest
+
+from dos import prop
+from dos.parsers import (
+    extract_arrow, extract_arrow_many, extract_datetime, extract_float, extract_number, extract_number_many,
+)
+
+
+@pytest.mark.parametrize("val, expected", [
+    ("123.45", Decimal("123.45")),
+    (" 12 ", Decimal("12")),
+    ("1e3", Decimal("1e3")),
+    ("$1,000.50", Decimal("1000.50")),
+    ("12 %", Decimal("12")),
+    ("1 000", Decimal("1000")),
+    ("(12.50)", Decimal("-12.50")),
+    ("$(12)", Decimal("-12")),
+    ("-", Decimal("0")),
+    (12, Decimal("12")),
+    (True, Decimal("1")),
+    (0.1, Decimal("0.1")),
+    (12.5, Decimal("12.5")),
+    (Decimal("1.10"), Decimal("1.10")),
+])
+def test_extract_number(val, expected):
+
+    number = extract_number(val)
+
+    assert number == expected
+    assert str(number) == str(expected)
+
+
+@pytest.mark.parametrize("val", ["banana_phone", "(12", "12)", "1.2.3", ""])
+def test_extract_number_invalid(val):
+
+    with pytest.raises(InvalidOperation):
+        extract_number(val)
+
+
+@pytest.mark.parametrize("val, expected", [
+    ("123.45", 123.45),
+    ("$1,000.50", 1000.5),
+    ("(12.50)", -12.5),
+    ("-", 0.0),
+    (Decimal("1.5"), 1.5),
+    (3, 3.0),
+])
+def test_extract_float(val, expected):
+
+    number = extract_float(val)
+
+    assert type(number) is float
+    assert number == expected
+
+
+def test_number_as_float():
+
+    assert prop.Number().check_input("price", {"price": "$2.50"}) == (Decimal("2.50"), None)
+    assert prop.Number(as_float=True).check_input("price", {"price": "$2.50"}) == (2.5, None)
+    assert prop.Number(as_float=True).evolve(required=False).as_float is True
+
+    value, failure = prop.Number(as_float=True).check_input("price", {"price": "banana_phone"})
+
+    assert value is None
+    assert str(failure.message) == "The value 'banana_phone' from field 'price' is the wrong type, expected: Number"
+
+
+@pytest.mark.parametrize("val", [
+    "2020-07-01",
+    "2020-07-01T10:00:00",
+    "2020-07-01T10:00:00Z",
+    "2020-07-01T10:00:00+05:30",
+    "2020-07-01T10:00:00-0700",
+    "2020-07-01 10:00",
+    "2020-07-01T10",
+    "2020-07-01T10:00+05",
+    "2020-07-01T10:00:00.123",
+    "2020-07-01T10:00:00,123",
+    "2020-07-01T10:00:00.1234567",
+    "2020-07-01T10:00:00.1234567+01:00",
+    "2020-07-01T24:00:00",
+    "2020-07",
+    "2020-183",
+    " 2020-07-01 ",
+])
+def test_extract_arrow_iso(val):
+
+    parsed = extract_arrow(val)
+
+    assert parsed == arrow.get(val.strip())
+    assert str(parsed) == str(arrow.get(val.strip()))
+
+
+@pytest.mark.parametrize("val, expected", [
+    ("7/1/2020", arrow.get(2020, 7, 1)),
+    ("07/01/20", arrow.get(2020, 7, 1)),
+    ("20200701", arrow.get(2020, 7, 1)),
+    (20200701, arrow.get(2020, 7, 1)),
+])
+def test_extract_arrow_other_formats(val, expected):
+
+    assert extract_arrow(val) == expected
+
+
+def test_extract_arrow_invalid():
+
+    # datetime.fromisoformat accepts these, but arrow doesn't.
+    for val in (
+        "2020-13-01", "not a date", "13/45/2020", "2020-07-01X10:00", "2020-07-01t10:00",
+        "2020-07-01T10:00:00 +05:30", "2020-07-01T10:00:00 Z", "2020-07-01T10:00:00+05:30:00", "2020-07-01T10:30.5",
+    ):
+        with pytest.raises(ValueError):
+            extract_arrow(val)
+
+
+@pytest.mark.parametrize("vals", [
+    [1, 2, 3],
+    [0.1, 2.5],
+    ["1.5", "2", "1e3"],
+    ["1.5", "$1,000", "(12)"],
+    [1, 0.1, "2", Decimal("3.5"), True],
+    [],
+])
+def test_extract_number_many(vals):
+
+    assert extract_number_many(vals) == [extract_number(val) for val in vals]
+
+
+@pytest.mark.parametrize("vals", [
+    ["2020-07-01", " 2020-07-01T10:00:00+01:00 ", "2020-07-01T10:00:00Z"],
+    ["2020-07-01", "7/1/2020", 20200701],
+    ["2020-07-01", "2020-183"],
+    ["2020-07-01T10:00:00.1234567+01:00"],
+])
+def test_extract_arrow_many(vals):
+
+    parsed = extract_arrow_many(vals)
+
+    assert parsed == [extract_arrow(val) for val in vals]
+    assert list(map(str, parsed)) == [str(extract_arrow(val)) for val in vals]
+
+
+def test_extract_many_invalid():
+
+    with pytest.raises(InvalidOperation):
+        extract_number_many(["1", "one"])
+
+    with pytest.raises(ValueError):
+        extract_arrow_many(["2020-07-01", "2020-13-01"])
+
+
+@pytest.mark.parametrize("val, expected", [
+    ("2020-07-01", datetime.date(2020, 7, 1)),
+    ("7/1/2020", datetime.date(2020, 7, 1)),
+    ("07/01/20", datetime.date(2020, 7, 1)),
+    ("20200701", datetime.date(2020, 7, 1)),
+    (20200701, datetime.date(2020, 7, 1)),
+    ("2020-07-01T10:30:00", datetime.datetime(2020, 7, 1, 10, 30)),
+    ("2020-07-01T10:30:00Z", datetime.datetime(2020, 7, 1, 10, 30, tzinfo=datetime.timezone.utc)),
+    ("2020-183", datetime.date(2020, 7, 1)),
+    ("2020/07/01", datetime.date(2020, 7, 1)),
+    ("2020-07-01T10:00:00.1234567", datetime.datetime(2020, 7, 1, 10, 0, 0, 123457)),
+    ("20200701T100000", datetime.datetime(2020, 7, 1, 10)),
+    ("20200701T100000+0200", datetime.datetime(
+        2020, 7, 1, 10, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+    )),
+    (datetime.date(2020, 7, 1), datetime.date(2020, 7, 1)),
+    (arrow.get(2020, 7, 1), datetime.datetime(2020, 7, 1, tzinfo=datetime.timezone.utc)),
+])
+def test_extract_datetime(val, expected):
+
+    parsed = extract_datetime(val)
+
+    assert type(parsed) is type(expected)
+    assert parsed == expected
+
+    if isinstance(expected, datetime.datetime):
+        assert parsed.tzinfo == expected.tzinfo
@@ -0,0 +1,234 @@
+import copy
+import datetime
+import pickle
+from decimal import Decimal
+from http import HTTPStatus
+
+import arrow
+import pytest
+
+from dos import prop, validators
+from dos.flask_wrappers import validate_and_parse_input
+
+
+def test_props_are_immutable():
+
+    string_prop = prop.String("A string.")
+
+    with pytest.raises(AttributeError):
+        string_prop.required = False
+
+    with pytest.raises(AttributeError):
+        del string_prop.description
+
+    with pytest.raises(AttributeError):
+        string_prop.something_new = True
+
+    assert not hasattr(string_prop, "__dict__")
+
+
+class NotEmpty(validators.Validator):
+    supported_prop_classes = [prop.Object]
+
+
+def test_evolve():
+
+    original = prop.Object(
+        structure={"name": prop.String()},
+        description="An object.",
+        validators=[NotEmpty()],
+    )
+
+    evolved = original.evolve(required=False, nullable=True)
+
+    assert type(evolved) is prop.Object
+    assert (evolved.required, evolved.nullable) == (False, True)
+    assert evolved.description == "An object."
+    assert evolved.structure is original.structure
+    assert evolved.validators is original.validators
+    assert (original.required, original.nullable) == (True, False)
+
+
+def test_evolve_unknown_argument():
+
+    with pytest.raises(TypeError):
+        prop.String().evolve(not_an_argument=True)
+
+
+def test_props_pickle():
+
+    original = prop.Object(
+        structure={
+            "name": prop.String("The name.", validators=[validators.Pattern("^[A-Z]")]),
+            "born": prop.DateTime(required=False, native=True, cache_size=8),
+            "weights": prop.Array(repeated_structure=prop.Number(as_float=True), nullable=True),
+        },
+        description="An object.",
+    )
+
+    unpickled = pickle.loads(pickle.dumps(original))
+
+    assert type(unpickled) is prop.Object
+    assert unpickled.description == "An object."
+    assert list(unpickled.structure) == ["name", "born", "weights"]
+    assert unpickled.structure["name"].validators[0].pattern.pattern == "^[A-Z]"
+    assert (unpickled.structure["born"].native, unpickled.structure["born"].cache_size) == (True, 8)
+    assert unpickled.structure["born"].parse_input("2020-07-01") == datetime.date(2020, 7, 1)
+    assert unpickled.structure["weights"].nullable is True
+    assert unpickled.structure["weights"].repeated_structure.as_float is True
+
+
+def test_validators_normalized_to_tuple():
+
+    exact_length = validators.ExactLength(3)
+
+    assert prop.String().validators == ()
+    assert prop.String(validators=exact_length).validators == (exact_length,)
+    assert prop.String(validators=[exact_length]).validators == (exact_length,)
+    assert prop.String(validators=exact_length).check_input("code", {"code": "abcd"})[1] is not None
+
+
+def test_validators_bound_at_definition():
+
+    with pytest.raises(prop.ValidationError):
+        prop.Integer().evolve(validators=validators.SocialSecurityNumber())
+
+    with pytest.raises(prop.ValidationError):
+        prop.DateTime(validators=validators.ExactLength(3))
+
+
+def test_copies_are_shared():
+
+    array_prop = prop.Array(repeated_structure=prop.Integer())
+
+    assert copy.copy(array_prop) is array_prop
+    assert copy.deepcopy({"array": array_prop})["array"] is array_prop
+
+
+def test_check_input_returns_failures():
+
+    assert prop.Integer().check_input("count", {"count": "12"}) == (12, None)
+
+    value, failure = prop.Integer().check_input("count", {"count": None})
+
+    assert value is None
+    assert isinstance(failure, prop.ValidationFailure)
+    assert failure.message == "Non nullable field 'count' is null!"
+
+    value, failure = prop.Object(structure={"name": prop.String()}).check_input("dog", {"dog": {"name": 1}})
+
+    assert value is None
+    assert failure.get_field_error_messages("dog") == {
+        "dog.name": "The value 1 from field 'dog.name' is the wrong type, expected: String",
+    }
+
+
+def test_check_output_returns_failures():
+
+    array_prop = prop.Array(repeated_structure=prop.String())
+
+    assert array_prop.check_output("names", {"names": ["a", "b"]}) == (["a", "b"], None)
+
+    value, failure = array_prop.check_output("names", {"names": ["a", 2]})
+
+    assert value is None
+    assert str(failure.message) == "The value 2 from field 'None' is the wrong type, expected: String"
+
+    with pytest.raises(prop.ValidationError):
+        array_prop.format_output_and_validate("names", {"names": ["a", 2]})
+
+
+def test_check_input_honours_raising_overrides():
+
+    class NotBob(prop.String):
+        __slots__ = ()
+
+        def validate(self, output_structure_field_name, body, prop_value):
+            if prop_value == "Bob":
+                raise prop.ValidationError("No Bobs!")
+
+            return super().validate(output_structure_field_name, body, prop_value)
+
+    assert NotBob().check_input("name", {"name": "Spot"}) == ("Spot", None)
+
+    value, failure = NotBob().check_input("name", {"name": "Bob"})
+
+    assert value is None
+    assert str(failure.message) == "No Bobs!"
+
+
+def test_error_messages_are_bounded():
+
+    huge = "x" * 5_000_000
+
+    http_status, reject_dict, _ = validate_and_parse_input({"count": huge}, {"count": prop.Integer()})
+
+    message = reject_dict["field_error_messages"]["count"]
+
+    assert http_status == HTTPStatus.BAD_REQUEST
+    assert message.startswith("The value 'xxx")
+    assert message.endswith("' from field 'count' is the wrong type, expected: Integer")
+    assert len(message) < 300
+
+
+def test_error_messages_are_lazy():
+
+    class Unprintable:
+        def __repr__(self):
+            raise AssertionError("Formatted a discarded message!")
+
+    value, failure = prop.String().check_input("name", {"name": Unprintable()})
+
+    assert value is None
+    assert isinstance(failure.message, prop.ErrorMessage)
+
+
+def test_date_time_parse_cache():
+
+    date_time = prop.DateTime(cache_size=2)
+
+    first = date_time.check_input("day", {"day": "2024-01-31"})[0]
+
+    assert date_time.check_input("day", {"day": "2024-01-31"})[0] is first
+    assert date_time.check_input("day", {"day": 20240131})[0] == first
+    assert date_time.check_input("day", {"day": "not a date"})[1] is not None
+
+    info = date_time.cache_info()
+    assert (info.hits, info.misses, info.currsize, info.maxsize) == (1, 3, 2, 2)
+
+    assert prop.DateTime().cache_info() is None
+    assert date_time.evolve(required=False).cache_info().currsize == 0
+
+
+def test_date_time_native():
+
+    native = prop.DateTime(native=True)
+
+    assert native.check_input("day", {"day": "2024-01-31"}) == (datetime.date(2024, 1, 31), None)
+    assert native.check_output("day", {"day": datetime.date(2024, 1, 31)}) == ("2024-01-31", None)
+    assert native.check_output("day", {"day": datetime.datetime(2024, 1, 31, 8)}) == ("2024-01-31T08:00:00", None)
+    assert native.check_output("day", {"day": "2024-01-31"}) == ("2024-01-31", None)
+
+    assert prop.DateTime().check_output("day", {"day": datetime.date(2024, 1, 31)})[1] is not None
+
+
+def test_primitive_arrays_parsed_in_bulk():
+
+    numbers = prop.Array(repeated_structure=prop.Number(validators=validators.Range(minimum=0)))
+
+    assert numbers.check_input("prices", {"prices": ["1.5", 2, "$3"]}) == (
+        [Decimal("1.5"), Decimal("2"), Decimal("3")], None
+    )
+
+    # Any element failing falls back to element by element checks, for the same errors.
+    _, failure = numbers.check_input("prices", {"prices": ["1.5", "one", -1]})
+    assert {path: str(message) for path, message in failure.field_errors.items()} == {
+        "prices[1]": "The value 'one' from field 'prices[1]' is the wrong type, expected: Number",
+        "prices[2]": "The value -1 is less than the minimum of 0!",
+    }
+
+    dates = prop.Array(repeated_structure=prop.DateTime())
+
+    parsed, failure = dates.check_input("days", {"days": ["2020-07-01", "2020-07-02T10:00:00Z"]})
+    assert failure is None
+    assert parsed == [arrow.get(2020, 7, 1), arrow.get(2020, 7, 2, 10)]
@@ -0,0 +1,124 @@
+from dos import prop, prop_wrapper, validators
+from dos.cache import LRUCache
+from dos.schema import Fields
+
+
+class DogFields(Fields):
+    base_schema = {
+        "name": prop.String("The dog's name."),
+        "breed": prop.String("The dog's breed."),
+        "owner": prop.Object(structure={"name": prop.String()}),
+        "tag": prop_wrapper.OneOf([prop.String(), prop.Integer()]),
+    }
+
+    def __init__(self):
+        super().__init__(self.base_schema)
+
+
+def test_specialize_shares_untouched_props():
+
+    specialized = DogFields().specialize(only=["name", "owner"])
+
+    assert list(specialized) == ["name", "owner"]
+    assert specialized["name"] is DogFields.base_schema["name"]
+    assert specialized["owner"] is DogFields.base_schema["owner"]
+
+
+def test_specialize_clones_overridden_props():
+
+    specialized = DogFields().specialize(overrides={
+        "breed": {"required": False},
+        "tag": {"required": False},
+    })
+
+    assert specialized["breed"] is not DogFields.base_schema["breed"]
+    assert specialized["breed"].required is False
+    assert specialized["breed"].description == "The dog's breed."
+    assert DogFields.base_schema["breed"].required is True
+
+    assert specialized["tag"].required is False
+    assert DogFields.base_schema["tag"].required is True
+
+    assert specialized["name"] is DogFields.base_schema["name"]
+
+
+def test_specialize_exclude_and_all():
+
+    assert list(DogFields().specialize(exclude=["owner", "tag"])) == ["name", "breed"]
+
+    everything = DogFields().all()
+    assert everything == DogFields.base_schema
+    assert everything is not DogFields.base_schema
+
+
+class CachedDogFields(DogFields):
+    specialization_cache = LRUCache(maxsize=2)
+
+
+def test_specialize_is_memoized():
+
+    CachedDogFields.specialization_cache.clear()
+
+    first = CachedDogFields().specialize(overrides={"breed": {"required": False}}, only=["name", "breed"])
+    second = CachedDogFields().specialize(only=["name", "breed"], overrides={"breed": {"required": False}})
+
+    assert first == second
+    assert first is not second
+    assert first["breed"] is second["breed"]
+
+    info = CachedDogFields.specialization_cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_specialize_cache_evicts_least_recently_used():
+
+    CachedDogFields.specialization_cache.clear()
+
+    CachedDogFields().all()
+    CachedDogFields().specialize(only=["name"])
+    CachedDogFields().all()
+    CachedDogFields().specialize(exclude=["name"])
+
+    info = CachedDogFields.specialization_cache.info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 3, 1, 2)
+
+
+def test_specialize_unhashable_overrides_bypass_cache():
+
+    CachedDogFields.specialization_cache.clear()
+
+    specialized = CachedDogFields().specialize(overrides={"name": {"validators": [validators.ExactLength(4)]}})
+
+    assert len(specialized["name"].validators) == 1
+    assert CachedDogFields.specialization_cache.info().currsize == 0
+
+
+def test_specialize_cache_sees_base_schema_changes():
+
+    class GrowingFields(Fields):
+        specialization_cache = LRUCache(maxsize=8)
+        base_schema = {"a": prop.String()}
+
+        def __init__(self):
+            super().__init__(self.base_schema)
+
+    assert list(GrowingFields().all()) == ["a"]
+
+    GrowingFields.base_schema["b"] = prop.String()
+
+    assert list(GrowingFields().all()) == ["a", "b"]
+
+
+def test_specialize_accepts_generators():
+
+    CachedDogFields.specialization_cache.clear()
+
+    for _ in range(2):
+        only = CachedDogFields().specialize(only=(name for name in ["name", "breed"]))
+        exclude = CachedDogFields().specialize(exclude=(name for name in ["owner", "tag"]))
+
+        assert list(only) == ["name", "breed"]
+        assert list(exclude) == ["name", "breed"]
+
+    info = CachedDogFields.specialization_cache.info()
+    assert (info.hits, info.misses) == (2, 2)
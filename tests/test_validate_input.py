@@ -1,7 +1,13 @@
+from decimal import Decimal
 from http import HTTPStatus
 
+import arrow
+from flask import Flask, request
+import pytest
+
 from dos import prop, prop_wrapper, validators
-from dos.flask_wrappers import validate_input
+from dos.flask_wrappers import decimal_json_loads, validate_and_parse_input, validate_input
+from dos.schema import FrozenSchema
 
 
 def test_validate_input():
@@ -209,6 +215,58 @@ def test_validate_input_one_of():
     assert http_status is HTTPStatus.OK
 
 
+def test_validate_input_one_of_overlapping_types():
+
+    input_schema = {
+        "id": prop_wrapper.OneOf([
+            prop.Boolean(),
+            prop.Integer(),
+            prop.Object(structure={"name": prop.String()}),
+        ])
+    }
+
+    assert validate_and_parse_input({"id": True}, input_schema) == (HTTPStatus.OK, {}, {"id": True})
+    assert validate_and_parse_input({"id": "12"}, input_schema) == (HTTPStatus.OK, {}, {"id": 12})
+    assert validate_and_parse_input({"id": {"name": "Spot"}}, input_schema) == (
+        HTTPStatus.OK, {}, {"id": {"name": "Spot"}}
+    )
+
+
+def test_validate_input_one_of_discriminator():
+
+    dog = prop.Object(structure={"type": prop.String(), "barks": prop.Boolean()})
+    cat = prop.Object(structure={"type": prop.String(), "lives": prop.Integer()})
+
+    input_schema = {
+        "pet": prop_wrapper.OneOf(discriminator="type", mapping={"dog": dog, "cat": cat}),
+    }
+
+    assert validate_and_parse_input({"pet": {"type": "cat", "lives": "9"}}, input_schema) == (
+        HTTPStatus.OK, {}, {"pet": {"type": "cat", "lives": 9}}
+    )
+
+    http_status, reject_dict, _ = validate_and_parse_input({"pet": {"type": "dog", "barks": "yes"}}, input_schema)
+    assert http_status == HTTPStatus.BAD_REQUEST
+    assert reject_dict["field_error_messages"] == {
+        "pet.barks": "The value 'yes' from field 'pet.barks' is the wrong type, expected: Boolean",
+    }
+
+    http_status, reject_dict, _ = validate_and_parse_input({"pet": {"type": "fish"}}, input_schema)
+    assert http_status == HTTPStatus.BAD_REQUEST
+    assert reject_dict["field_error_messages"] == {
+        "pet": "The value 'fish' of 'type' from field 'pet' is not one of the known values: ['dog', 'cat']",
+    }
+
+
+def test_one_of_discriminator_requires_tagged_objects():
+
+    with pytest.raises(ValueError):
+        prop_wrapper.OneOf(discriminator="type", mapping={"dog": prop.Object(structure={"barks": prop.Boolean()})})
+
+    with pytest.raises(ValueError):
+        prop_wrapper.OneOf([prop.String()], discriminator="type")
+
+
 def test_validate_input_one_of_invalid():
 
     input_schema = {
@@ -314,28 +372,15 @@ def test_validate_input_exact_length_string():
 
 def test_validate_input_exact_length_object():
 
-    input_schema = {
-        "basic_object": prop.Object(
+    with pytest.raises(prop.ValidationError) as e:
+        prop.Object(
             structure={
                 "basic_string": prop.String()
             },
             validators=[validators.ExactLength(8)]
-        ),
-    }
-
-    given_request = {
-        "basic_object": {
-            "basic_string": "this is irrelevant",
-        }
-    }
-
-    http_status, reject_dict = validate_input(given_request, input_schema)
-    assert reject_dict == {
-        'message': 'A field has an error.',
-        'field_error_messages': {'basic_object': 'ExactLength is not supported for class Object!!'}
-    }
+        )
 
-    assert http_status == HTTPStatus.BAD_REQUEST
+    assert e.value.message == "ExactLength is not supported for class Object!!"
 
 
 def test_validate_social_security_number():
@@ -360,23 +405,11 @@ def test_validate_social_security_number():
 
 
 def test_validate_number_social_security_number():
-    input_schema = {
-        "social_security_number": prop.Number(validators=[validators.SocialSecurityNumber()]),
-    }
-
-    given_request = {
-        "social_security_number": "219099999",
-    }
 
-    http_status, reject_dict = validate_input(given_request, input_schema)
-    assert reject_dict == {
-        'message': 'A field has an error.',
-        'field_error_messages': {
-            'social_security_number': 'SocialSecurityNumber is not supported for class Number!!'
-        }
-    }
+    with pytest.raises(prop.ValidationError) as e:
+        prop.Number(validators=[validators.SocialSecurityNumber()])
 
-    assert http_status == HTTPStatus.BAD_REQUEST
+    assert e.value.message == "SocialSecurityNumber is not supported for class Number!!"
 
 
 def test_impossible_validation():
@@ -420,4 +453,202 @@ def test_multiple_invalid_fields_validation():
         }
     }
 
-    assert http_status == HTTPStatus.BAD_REQUEST
\ No newline at end of file
+    assert http_status == HTTPStatus.BAD_REQUEST
+
+
+def test_validate_input_wide_schema_field_order():
+
+    input_schema = {f"optional_{number}": prop.String(required=False) for number in range(200)}
+    input_schema["first_required"] = prop.String()
+    input_schema["second_required"] = prop.String()
+
+    given_request = {
+        "zebra": 1,
+        "optional_3": "fine",
+        "aardvark": 2,
+    }
+
+    http_status, reject_dict = validate_input(given_request, FrozenSchema(input_schema))
+    assert reject_dict == {
+        "message": ("Unexpected fields were sent to the server: ['zebra', 'aardvark'] /// "
+                    "Required fields are missing: ['first_required', 'second_required']")
+    }
+    assert http_status == HTTPStatus.BAD_REQUEST
+
+
+def test_validate_input_json_body_not_an_object():
+
+    input_schema = {
+        "basic_string": prop.String(),
+    }
+
+    app = Flask(__name__)
+
+    with app.test_request_context(json=["not", "an", "object"]):
+        http_status, reject_dict = validate_input(request, input_schema)
+
+    assert reject_dict == {
+        "message": "Improperly formatted request body. Must provide valid JSON, even if it's just {}!"
+    }
+    assert http_status == HTTPStatus.PRECONDITION_FAILED
+
+
+def test_validate_and_parse_input():
+
+    input_schema = {
+        "amount": prop.Number(),
+        "count": prop.Integer(),
+        "date": prop.DateTime(),
+        "id": prop_wrapper.OneOf([prop.Integer(), prop.String()]),
+        "optional": prop.String(required=False),
+    }
+
+    given_request = {
+        "amount": "$1,000.50",
+        "count": "3",
+        "date": "2020-07-01",
+        "id": "12",
+    }
+
+    http_status, reject_dict, validated_input = validate_and_parse_input(given_request, input_schema)
+    assert http_status is HTTPStatus.OK
+    assert reject_dict == {}
+    assert validated_input == {
+        "amount": Decimal("1000.50"),
+        "count": 3,
+        "date": arrow.get(2020, 7, 1),
+        "id": 12,
+    }
+
+
+def test_validate_and_parse_input_decimal_json():
+
+    input_schema = {
+        "amount": prop.Number(),
+        "prices": prop.Array(repeated_structure=prop.Number()),
+        "count": prop.Integer(),
+    }
+
+    app = Flask(__name__)
+    data = '{"amount": 0.12345678901234567890, "prices": [0.1, 2.50], "count": 3}'
+
+    with app.test_request_context(data=data, content_type="application/json"):
+        _, _, float_input = validate_and_parse_input(request, input_schema)
+        http_status, reject_dict, validated_input = validate_and_parse_input(
+            request, input_schema, json_loads=decimal_json_loads
+        )
+
+    assert http_status is HTTPStatus.OK
+    assert reject_dict == {}
+    assert validated_input == {
+        "amount": Decimal("0.12345678901234567890"),
+        "prices": [Decimal("0.1"), Decimal("2.50")],
+        "count": 3,
+    }
+    assert float_input["amount"] == Decimal("0.12345678901234568")
+
+    with app.test_request_context(data=data, content_type="text/plain"):
+        http_status, _ = validate_input(request, input_schema, json_loads=decimal_json_loads)
+
+    assert http_status == HTTPStatus.PRECONDITION_FAILED
+
+
+def test_validate_and_parse_input_invalid():
+
+    input_schema = {
+        "count": prop.Integer(),
+    }
+
+    http_status, reject_dict, validated_input = validate_and_parse_input({"count": "three"}, input_schema)
+    assert http_status == HTTPStatus.BAD_REQUEST
+    assert reject_dict["message"] == "A field has an error."
+    assert validated_input is None
+
+
+def test_validate_input_nested_errors():
+
+    input_schema = {
+        "items": prop.Array(
+            repeated_structure=prop.Object(
+                structure={
+                    "name": prop.String(),
+                    "price": prop.Number(),
+                    "tags": prop.Array(repeated_structure=prop.String(), required=False),
+                }
+            )
+        ),
+    }
+
+    given_request = {
+        "items": [
+            {"name": "fine", "price": "1.50"},
+            {"price": "2.00"},
+            {"name": "bad price", "price": "banana_phone"},
+            {"name": "bad tag", "price": "3", "tags": ["ok", 7]},
+            "not an object",
+        ]
+    }
+
+    http_status, reject_dict = validate_input(given_request, input_schema)
+    assert reject_dict["message"] == "Multiple fields have an error."
+    # In document order, even though nested values are checked breadth-first.
+    assert list(reject_dict["field_error_messages"].items()) == [
+        ("items[1].name", "The field 'items[1].name' is required but not found in the body!"),
+        ("items[2].price", "The value 'banana_phone' from field 'items[2].price' is the wrong type, expected: Number"),
+        ("items[3].tags[1]", "The value 7 from field 'items[3].tags[1]' is the wrong type, expected: String"),
+        ("items[4]", "The value 'not an object' from field 'items[4]' is the wrong type, expected: Object"),
+    ]
+    assert http_status == HTTPStatus.BAD_REQUEST
+
+
+def test_validate_and_parse_nested_input():
+
+    input_schema = {
+        "order": prop.Object(
+            structure={
+                "placed": prop.DateTime(),
+                "lines": prop.Array(
+                    repeated_structure=prop.Object(structure={"amount": prop.Number()}),
+                ),
+                "note": prop.String(required=False, nullable=True),
+            }
+        ),
+    }
+
+    given_request = {
+        "order": {
+            "placed": "2020-07-01",
+            "lines": [{"amount": "1.50"}, {"amount": 2}],
+        }
+    }
+
+    http_status, reject_dict, validated_input = validate_and_parse_input(given_request, input_schema)
+    assert (http_status, reject_dict) == (HTTPStatus.OK, {})
+    assert validated_input == {
+        "order": {
+            "placed": arrow.get(2020, 7, 1),
+            "lines": [{"amount": Decimal("1.50")}, {"amount": Decimal(2)}],
+        }
+    }
+
+
+def test_validate_deeply_nested_input():
+
+    depth = 5000
+
+    nested_prop = prop.Integer()
+    nested_value = 1
+
+    for _ in range(depth):
+        nested_prop = prop.Array(repeated_structure=nested_prop)
+        nested_value = [nested_value]
+
+    http_status, reject_dict, validated_input = validate_and_parse_input({"deep": nested_value}, {"deep": nested_prop})
+    assert (http_status, reject_dict) == (HTTPStatus.OK, {})
+
+    parsed = validated_input["deep"]
+    for _ in range(depth):
+        assert len(parsed) == 1
+        parsed = parsed[0]
+
+    assert parsed == 1
@@ -0,0 +1,125 @@
+from decimal import Decimal
+import re
+
+import pytest
+
+from dos import prop, validation_helpers, validators
+
+
+@pytest.mark.parametrize("field_prop, valid, invalid, message", [
+    (
+        prop.String(validators=validators.MinLength(3)),
+        ["abc", "abcd", None],
+        ["ab"],
+        "String is too short! The string 'ab' is 2 characters long, less than 3!",
+    ),
+    (
+        prop.String(validators=validators.MaxLength(3)),
+        ["", "abc", None],
+        ["abcd"],
+        "String is too long! The string 'abcd' is 4 characters long, more than 3!",
+    ),
+    (
+        prop.Integer(validators=validators.Range(minimum=1)),
+        [1, 500, None],
+        [0],
+        "The value 0 is less than the minimum of 1!",
+    ),
+    (
+        prop.Number(validators=validators.Range(minimum=0, maximum=Decimal("9.99"))),
+        [0, Decimal("9.99"), 4.5],
+        [Decimal("10")],
+        "The value 10 is more than the maximum of 9.99!",
+    ),
+    (
+        prop.String(validators=validators.Pattern(r"^[a-z]+$")),
+        ["spot", None],
+        ["Spot"],
+        "The string 'Spot' does not match the pattern ^[a-z]+$!",
+    ),
+    (
+        prop.String(validators=validators.OneOfValues(["dog", "cat"])),
+        ["dog", "cat", None],
+        ["fish"],
+        "The value 'fish' is not one of the allowed values: ['dog', 'cat']!",
+    ),
+    (
+        prop.Array(repeated_structure=prop.Integer(), validators=validators.MaxItems(2)),
+        [[], [1, 2], None],
+        [[1, 2, 3]],
+        "The array has 3 items, more than the maximum of 2!",
+    ),
+])
+def test_validator(field_prop, valid, invalid, message):
+
+    validator = field_prop.validators[0]
+    prop_class = type(field_prop)
+
+    for prop_value in valid:
+        assert validator.validate_prop(prop_class, prop_value) is None
+
+    assert str(validator.validate_prop(prop_class, invalid[0])) == message
+
+    assert [
+        error_message if error_message is None else str(error_message)
+        for error_message in validator.validate_many(prop_class, valid + invalid)
+    ] == [None] * len(valid) + [message]
+
+    assert str(field_prop.check_output("field", {"field": invalid[0]})[1].message) == message
+
+
+def test_validators_bind_to_supported_props():
+
+    with pytest.raises(prop.ValidationError):
+        prop.Integer(validators=validators.Pattern("[0-9]+"))
+
+    with pytest.raises(prop.ValidationError):
+        prop.String(validators=validators.MaxItems(3))
+
+
+SOCIAL_SECURITY_NUMBER_PATTERN = r"^(?!219099999|078051120)(?!666|000|9\d{2})\d{3}(?!00)\d{2}(?!0{4})\d{4}\Z"
+
+
+@pytest.mark.parametrize("potential_social_security_number", [
+    "578271234", "219099999", "078051120", "000123456", "666123456", "900123456", "999123456",
+    "123004567", "123450000", "12345678", "1234567890", "12345678a", "123-45-6789", "", 578271234,
+    "078051121", "219099998", "665123456", "899123456", "123014567", "123450001",
+])
+def test_social_security_number_matches_pattern(potential_social_security_number):
+
+    expected = re.match(SOCIAL_SECURITY_NUMBER_PATTERN, str(potential_social_security_number)) is not None
+
+    assert validation_helpers.validate_social_security_number(potential_social_security_number) is expected
+    assert validation_helpers.validate_social_security_numbers([potential_social_security_number]) == [expected]
+
+
+def test_social_security_number_validate_many():
+
+    validator = validators.SocialSecurityNumber()
+
+    assert [
+        error_message if error_message is None else str(error_message)
+        for error_message in validator.validate_many(prop.String, ["578271234", "219099999"])
+    ] == [None, "219099999 is not a valid social security number!"]
+
+
+def test_social_security_number_arrays_validated_together():
+
+    class SpyingSocialSecurityNumber(validators.SocialSecurityNumber):
+
+        calls = []
+
+        def validate_prop(self, prop_class, prop_value):
+            self.calls.append("one")
+            return super().validate_prop(prop_class, prop_value)
+
+        def validate_many(self, prop_class, prop_values):
+            self.calls.append("many")
+            return super().validate_many(prop_class, prop_values)
+
+    numbers = prop.Array(repeated_structure=prop.String(validators=SpyingSocialSecurityNumber()))
+
+    assert numbers.check_input("numbers", {"numbers": ["578271234", "578271235", "578271236"]}) == (
+        ["578271234", "578271235", "578271236"], None
+    )
+    assert SpyingSocialSecurityNumber.calls == ["many"]
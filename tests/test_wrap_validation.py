@@ -0,0 +1,190 @@
+from decimal import Decimal
+from http import HTTPStatus
+
+from flask import Flask
+import pytest
+
+from dos import flask_wrappers, prop
+from dos.flask_wrappers import decimal_json_loads, get_validated_input, wrap_route, wrap_validation
+
+
+def make_module(dynamic_schema=None):
+
+    fake_module = type('Module', (), {})
+    fake_module.calls = {"input_schema": 0, "output_schema": 0}
+
+    def handler():
+        return HTTPStatus.OK, {"name": "Spot", "secret": "not this"}
+
+    def input_schema():
+        fake_module.calls["input_schema"] += 1
+        return {"name": prop.String()}
+
+    def output_schema():
+        fake_module.calls["output_schema"] += 1
+        return {HTTPStatus.OK: {"name": prop.String()}}
+
+    fake_module.handler = handler
+    fake_module.input_schema = input_schema
+    fake_module.output_schema = output_schema
+
+    if dynamic_schema is not None:
+        fake_module.dynamic_schema = dynamic_schema
+
+    return fake_module
+
+
+def test_schemas_resolved_once():
+
+    app = Flask(__name__)
+    module = make_module()
+
+    wrapped = wrap_validation(module.handler, module)
+
+    for _ in range(3):
+        with app.test_request_context(json={"name": "Spot"}):
+            assert wrapped() == (HTTPStatus.OK, {"name": "Spot"})
+
+    assert module.calls == {"input_schema": 1, "output_schema": 1}
+
+
+def test_dynamic_schema_resolved_per_request():
+
+    app = Flask(__name__)
+    module = make_module(dynamic_schema=True)
+
+    wrapped = wrap_validation(module.handler, module)
+    assert module.calls == {"input_schema": 0, "output_schema": 0}
+
+    for _ in range(3):
+        with app.test_request_context(json={"name": "Spot"}):
+            assert wrapped() == (HTTPStatus.OK, {"name": "Spot"})
+
+    assert module.calls == {"input_schema": 3, "output_schema": 3}
+
+
+def test_frozen_schema_rejects_bad_input():
+
+    app = Flask(__name__)
+    module = make_module()
+
+    wrapped = wrap_validation(module.handler, module)
+
+    with app.test_request_context(json={"name": "Spot", "breed": "Poodle"}):
+        assert wrapped() == (
+            HTTPStatus.BAD_REQUEST,
+            {"message": "An unexpected field was sent to the server: breed"}
+        )
+
+
+def test_handler_receives_validated_input():
+
+    app = Flask(__name__)
+
+    fake_module = type('Module', (), {})
+
+    def handler():
+        validated_input = get_validated_input()
+        return HTTPStatus.OK, {"total": validated_input["price"] * validated_input["quantity"]}
+
+    def input_schema():
+        return {"price": prop.Number(), "quantity": prop.Integer()}
+
+    def output_schema():
+        return {HTTPStatus.OK: {"total": prop.Number()}}
+
+    fake_module.handler = handler
+    fake_module.input_schema = input_schema
+    fake_module.output_schema = output_schema
+
+    wrapped = wrap_validation(fake_module.handler, fake_module)
+
+    with app.test_request_context(json={"price": "$2.50", "quantity": "4"}):
+        assert wrapped() == (HTTPStatus.OK, {"total": Decimal("10.00")})
+
+
+def test_module_json_loads():
+
+    app = Flask(__name__)
+
+    fake_module = type('Module', (), {})
+    fake_module.json_loads = decimal_json_loads
+
+    def handler():
+        return HTTPStatus.OK, {"price": get_validated_input()["price"]}
+
+    fake_module.handler = handler
+    fake_module.input_schema = lambda: {"price": prop.Number()}
+    fake_module.output_schema = lambda: {HTTPStatus.OK: {"price": prop.Number()}}
+
+    wrapped = wrap_validation(fake_module.handler, fake_module)
+
+    with app.test_request_context(data='{"price": 1.10000000000000000001}', content_type="application/json"):
+        assert wrapped() == (HTTPStatus.OK, {"price": Decimal("1.10000000000000000001")})
+
+
+@pytest.mark.parametrize("compact, debug", [(None, False), (None, True), (False, False), (True, True)])
+def test_wrap_route_streams_iterators(monkeypatch, compact, debug):
+
+    monkeypatch.setattr(flask_wrappers, "STREAM_CHUNK_SIZE", 2)
+
+    app = Flask(__name__)
+    app.json.compact = compact
+    app.debug = debug
+
+    fake_module = type('Module', (), {})
+
+    def handler():
+        rows = ({"price": row / 2, "id": row} for row in range(5))
+        return HTTPStatus.OK, {"total": 5, "results": rows, "empty": iter([]), "ids": iter([1])}
+
+    def listing_handler():
+        return HTTPStatus.OK, {
+            "total": 5, "results": [{"price": row / 2, "id": row} for row in range(5)], "empty": [], "ids": [1],
+        }
+
+    fake_module.output_schema = lambda: {
+        HTTPStatus.OK: {
+            "total": prop.Integer(),
+            "results": prop.Array(repeated_structure=prop.Object(structure={"id": prop.Integer(), "price": prop.Number()})),
+            "empty": prop.Array(repeated_structure=prop.Integer()),
+            "ids": prop.Array(repeated_structure=prop.Integer()),
+        }
+    }
+
+    wrap_route(app, wrap_validation(handler, fake_module), "/stream", "get")
+    wrap_route(app, wrap_validation(listing_handler, fake_module), "/list", "get")
+    wrap_route(app, lambda: {"status": HTTPStatus.CREATED}, "/dict", "get")
+
+    client = app.test_client()
+    streamed = client.get("/stream")
+    listed = client.get("/list")
+
+    assert streamed.status_code == HTTPStatus.OK
+    assert len(list(client.get("/stream", buffered=False).response)) > 3
+    assert streamed.mimetype == "application/json"
+    assert streamed.get_data() == listed.get_data()
+
+    assert client.get("/dict").status_code == HTTPStatus.CREATED
+
+
+def test_wrap_route_streams_around_placeholder_lookalikes():
+
+    app = Flask(__name__)
+
+    fake_module = type('Module', (), {})
+    echoed = ["\x00dos array stream 0\x00", "dos array stream 0", "dos array stream"]
+
+    def handler():
+        return HTTPStatus.OK, {"echo": echoed, "ids": iter([1, 2])}
+
+    fake_module.output_schema = lambda: {
+        HTTPStatus.OK: {
+            "echo": prop.Array(repeated_structure=prop.String()),
+            "ids": prop.Array(repeated_structure=prop.Integer()),
+        }
+    }
+
+    wrap_route(app, wrap_validation(handler, fake_module), "/stream", "get")
+
+    assert app.test_client().get("/stream").get_json() == {"echo": echoed, "ids": [1, 2]}